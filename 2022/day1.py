@@ -63,25 +63,93 @@
 
 # Find the top three Elves carrying the most Calories. How many Calories are those Elves carrying in total?
 
-def day1():
-    f = open("day1-input.txt", "r")
+import heapq
+import os
+import sys
+from functools import partial
+
+ROOT = os.path.normpath(os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+if ROOT not in sys.path:
+    sys.path.append(ROOT)
+from aoc import chunked
+
+# One chunk of whole lines -> (head, top, tail)
+# Like top_k, a line that is not a number (blank, whitespace only, CRLF) ends an elf.
+# head is the total up to the first such line, which continues an elf from the
+# previous chunk (None if the chunk has none), top the k biggest elves that start
+# and end in the chunk, and tail the running total that continues in the next one
+def chunkTopK(k, data):
+    closed = []
+    current = 0
+    for line in data.splitlines():
+        line = line.strip()
+        if line.isdigit():
+            current += int(line)
+        else:
+            closed.append(current)
+            current = 0
+
+    if not closed:
+        return None, [], current
+    return closed[0], heapq.nlargest(k, closed[1:]), current
+
+# Large files: chunks are cut at line ends, the elves split between two chunks
+# are joined back from the tail of one and the head of the next,
+# and the overall top k is among those and the chunks' top k
+def top_k_parallel(k, file="day1-input.txt", workers=None):
+    totals = []
+    carry = 0
+    for head, top, tail in chunked.map_chunks(file, partial(chunkTopK, k), b"\n", workers):
+        if head is None:
+            carry += tail
+            continue
+        totals.append(carry + head)
+        totals += top
+        carry = tail
+    totals.append(carry)
+
+    return heapq.nlargest(k, totals)
+
+# Streaming top k: keep a min-heap of the k biggest totals seen so far
+# O(n log k) time, O(k) memory
+def top_k(k, file="day1-input.txt"):
     maxCur = 0
-    maxAll = []
+    maxK = []
 
-    for line in f:
-        if line.strip().isnumeric():
-            maxCur += int(line)
+    def keep(total):
+        if len(maxK) < k:
+            heapq.heappush(maxK, total)
         else:
-            maxAll.append(maxCur)
-            maxCur = 0
+            heapq.heappushpop(maxK, total)
+
+    with open(file, "r") as f:
+        for line in f:
+            if line.strip().isnumeric():
+                maxCur += int(line)
+            else:
+                keep(maxCur)
+                maxCur = 0
+
+    keep(maxCur)
+
+    return sorted(maxK, reverse=True)
+
+def top_k_auto(k, file):
+    if os.path.getsize(file) < chunked.PARALLEL_MIN:
+        return top_k(k, file)
+    return top_k_parallel(k, file)
+
+def part1(file="day1-input.txt"):
+    return top_k_auto(1, file)[0]
 
-    maxAll.append(maxCur)
+def part2(file="day1-input.txt"):
+    return sum(top_k_auto(3, file))
 
-    maxAll.sort()   # O(nlogn)
-    return maxAll
+def main():
+    maxTop = top_k(3)
 
-# Day 1
-maxAll = day1()
+    print ("Day 1, part 1: ", maxTop[0])
+    print ("Day 1, part 2: ", sum(maxTop))
 
-print ("Day 1, part 1: ", maxAll[-1])
-print ("Day 1, part 2: ", maxAll[-1] + maxAll[-2] + maxAll[-3])
+if __name__ == "__main__":
+    main()
@@ -72,46 +72,67 @@
 
 # Find the item type that corresponds to the badges of each three-Elf group. What is the sum of the priorities of those item types?
 
+import os
 import string
+import sys
+from functools import reduce
+from operator import and_, or_
+
+ROOT = os.path.normpath(os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+if ROOT not in sys.path:
+    sys.path.append(ROOT)
+from aoc.cache import cached_input
 
 GROUP_SIZE = 3
-priorities = dict(zip(string.ascii_lowercase + string.ascii_uppercase, range(1,53)))
 
-# Part 1
-def day3_part1():
-    f = open("day3-input.txt", "r")
-    priority_sum = 0
+# Item byte -> bit (priority - 1), so a set of items is a 52-bit mask
+ITEM_BIT = [0] * 256
+for priority, item in enumerate(string.ascii_lowercase + string.ascii_uppercase, 1):
+    ITEM_BIT[ord(item)] = 1 << (priority - 1)
 
-    for line in f:
-        str1 = line[ :len(line)//2]     # first half
-        str2 = line[len(line)//2: ]     # second half
-        inter = set(str1) & set(str2)   # compartments intersection
-        priority_sum += priorities[inter.pop()]
+def mask(items):
+    return reduce(or_, map(ITEM_BIT.__getitem__, items), 0)
 
-    return priority_sum
+# The only item of a mask is its highest bit, which gives the priority
+def priority(items_mask):
+    return items_mask.bit_length()
 
-# Part 2
-def day3_part2():
-    f = open("day3-input.txt", "r")
+# Parse once, shared by both parts
+@cached_input
+def processInput(file):
+    with open(file, "rb") as f:
+        rucksacks = [line.strip() for line in f]
+    return rucksacks
 
-    groups = [set() for i in range(GROUP_SIZE)]
+def day3_part1(rucksacks):
     priority_sum = 0
-    group_count = 0
 
-    for line in f:
-        groups[group_count] = line
-        group_count += 1
+    for line in rucksacks:
+        half = len(line) // 2
+        # compartments intersection
+        priority_sum += priority(mask(line[:half]) & mask(line[half:]))
+
+    return priority_sum
+
+def day3_part2(rucksacks):
+    masks = [mask(line) for line in rucksacks]
+    priority_sum = 0
 
-        if group_count >= GROUP_SIZE:
-            group_count = 0
-            inter = set(groups[0])
-            for g in groups:
-                inter = inter.intersection(g)
-            inter.discard('\n')
-            priority_sum += priorities[inter.pop()]
+    for i in range(0, len(masks) - GROUP_SIZE + 1, GROUP_SIZE):
+        priority_sum += priority(reduce(and_, masks[i:i + GROUP_SIZE]))
 
     return priority_sum
 
-# Day 3
-print("Day 3, part 1: ", day3_part1())
-print("Day 3, part 2: ", day3_part2())
+def part1(file="day3-input.txt"):
+    return day3_part1(processInput(file))
+
+def part2(file="day3-input.txt"):
+    return day3_part2(processInput(file))
+
+def main():
+    rucksacks = processInput("day3-input.txt")
+    print("Day 3, part 1: ", day3_part1(rucksacks))
+    print("Day 3, part 2: ", day3_part2(rucksacks))
+
+if __name__ == "__main__":
+    main()
@@ -68,35 +68,134 @@
 
 # In how many assignment pairs do the ranges overlap?
 
+import os
+import re
+import sys
+from bisect import bisect_left, bisect_right
+
+ROOT = os.path.normpath(os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+if ROOT not in sys.path:
+    sys.path.append(ROOT)
+from aoc.cache import cached_input
+
+NUMBER = re.compile(rb"\d+")
+
 def contains(start1, end1, start2, end2):
     return (start1 <= start2 and end1 >= end2) or (start2 <= start1 and end2 >= end1)
 
 def overlaps(start1, end1, start2, end2):
     return max(start1,start2) <= min(end1,end2)
 
-def day4():
-    f = open("day4-input.txt", "r")
+# All the numbers of a block in one regex call, grouped by 4: start1, end1, start2, end2
+def parsePairs(data):
+    numbers = iter(map(int, NUMBER.findall(data)))
+    return list(zip(numbers, numbers, numbers, numbers))
+
+# Whole file at once
+@cached_input
+def processInput(file):
+    with open(file, "rb") as f:
+        return parsePairs(f.read())
+
+# Chunked mode for files too large to load, chunks are cut after the last full line
+def iterPairs(file, chunk_size=1 << 24):
+    with open(file, "rb") as f:
+        rest = b""
+        while chunk := f.read(chunk_size):
+            chunk = rest + chunk
+            cut = chunk.rfind(b"\n") + 1
+            rest = chunk[cut:]
+            yield from parsePairs(chunk[:cut])
+        yield from parsePairs(rest)
+
+# Both counts in one pass
+def day4(pairs):
     contain_ct = 0
     overlap_ct = 0
 
-    for line in f:
-        ranges = line.split(',')
-        rng1 = ranges[0].strip().split('-')
-        rng2 = ranges[1].strip().split('-')
-
-        start1 = int(rng1[0])
-        end1   = int(rng1[-1])
-        start2 = int(rng2[0])
-        end2   = int(rng2[-1])
-
-        if contains(start1, end1, start2, end2):
+    for pair in pairs:
+        if contains(*pair):
             contain_ct += 1
-        if overlaps(start1, end1, start2, end2):
+        if overlaps(*pair):
             overlap_ct += 1
 
     return contain_ct, overlap_ct
 
-# Day 3
-part1, part2 = day4()
-print("Day 4, part 1:", part1)
-print("Day 4, part 2:", part2)
+# Every assignment of the file, two per line
+def assignments(pairs):
+    return [(start, end) for pair in pairs for start, end in (pair[:2], pair[2:])]
+
+# Number of pairs of assignments, across all lines, that overlap
+# O(n log n): for each assignment, count the others starting before it ends,
+# minus those that ended before it starts
+def overlapping_pairs(ranges):
+    starts = sorted(start for start, _ in ranges)
+    ends = sorted(end for _, end in ranges)
+
+    total = 0
+    for start, end in ranges:
+        # -1 to not count the assignment itself
+        total += bisect_right(starts, end) - bisect_left(ends, start) - 1
+
+    # every pair was counted from both sides
+    return total // 2
+
+# Assignment contained in the most other assignments, as (index, count)
+# Sweep by start, with a Fenwick tree over the ends seen so far
+# O(n log n)
+def most_covered(ranges):
+    ends = sorted(set(end for _, end in ranges))
+    tree = [0] * (len(ends) + 1)
+
+    def add(i):
+        i += 1
+        while i <= len(ends):
+            tree[i] += 1
+            i += i & -i
+
+    def count_before(i):
+        # assignments seen so far with end index < i
+        total = 0
+        while i > 0:
+            total += tree[i]
+            i -= i & -i
+        return total
+
+    # Start ascending, end descending: whatever contains an assignment comes before it
+    order = sorted(range(len(ranges)), key=lambda i: (ranges[i][0], -ranges[i][1]))
+    best, best_ct = None, -1
+    seen = 0
+    i = 0
+    while i < len(order):
+        # Identical assignments contain each other, handle them as one group
+        j = i
+        while j < len(order) and ranges[order[j]] == ranges[order[i]]:
+            j += 1
+
+        start, end = ranges[order[i]]
+        e = bisect_left(ends, end)
+        # earlier assignments start at or before this one, the ones ending at or after it contain it
+        covered_ct = seen - count_before(e) + (j - i - 1)
+        if covered_ct > best_ct:
+            best, best_ct = order[i], covered_ct
+
+        for _ in range(i, j):
+            add(e)
+        seen += j - i
+        i = j
+
+    return best, best_ct
+
+def part1(file="day4-input.txt"):
+    return day4(processInput(file))[0]
+
+def part2(file="day4-input.txt"):
+    return day4(processInput(file))[1]
+
+def main():
+    contain_ct, overlap_ct = day4(processInput("day4-input.txt"))
+    print("Day 4, part 1:", contain_ct)
+    print("Day 4, part 2:", overlap_ct)
+
+if __name__ == "__main__":
+    main()
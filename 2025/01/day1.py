@@ -1,20 +1,85 @@
-def processInput(file):
+import os
+import sys
+from array import array
 
-    with open(file, "r") as f:
-        lines = f.read().strip().split("\n")
+ROOT = os.path.normpath(os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", ".."))
+if ROOT not in sys.path:
+    sys.path.append(ROOT)
+from aoc import chunked
+from aoc.cache import cached_input
 
-    dials = []
-    for dial in lines:
-        num = int(dial[1:])
-        if dial[0] == "L":
-            num = num * -1
-        dials.append(num)
+# L turns into a minus sign, R is dropped: "L68 R48" -> "-68 48"
+SIGNS = bytes.maketrans(b"L", b"-")
+
+# One chunk of whole lines, as int64 so it goes back to the parent as raw bytes
+def parseRotations(data):
+    return array("q", map(int, data.translate(SIGNS, b"R").split()))
+
+# Large files are parsed in parallel chunks, joined back in file order
+# so the dial still turns through the rotations in sequence
+@cached_input
+def processInput(file, workers=None):
+
+    dials = array("q")
+    for chunk in chunked.map_chunks(file, parseRotations, b"\n", workers):
+        dials.extend(chunk)
 
     return dials
 
-def part1():
+# What one chunk does to the dial, for every dial position it may start at.
+# P is the sum of the chunk's rotations so far, the dial is at (start + P) % 100.
+# (net, zeros, passes, above):
+#   net       sum of the rotations, the dial ends at (start + net) % 100
+#   zeros[m]  rotations after which P % 100 == m, part 1 counts zeros[-start % 100]
+#   passes    part 2 count when starting at 0
+#   above[m]  how much each residue m of P changes the part 2 count when m + start >= 100,
+#             so starting at start adds sum(above[100 - start:])
+def summarizeRotations(data):
+    zeros = [0] * 100
+    above = [0] * 100
+    passes = 0
+    P = 0
+
+    for r in parseRotations(data):
+        # Zero crossings of a move from a to b, started from dial position 0:
+        # b // 100 - a // 100 to the right, (a - 1) // 100 - (b - 1) // 100 to the left
+        if r > 0:
+            a, b = P, P + r
+            passes += b // 100 - a // 100
+            above[b % 100] += 1
+            above[a % 100] -= 1
+        elif r < 0:
+            a, b = P - 1, P + r - 1
+            passes += a // 100 - b // 100
+            above[a % 100] += 1
+            above[b % 100] -= 1
+        P += r
+        zeros[P % 100] += 1
+
+    return P, zeros, passes, above
+
+# Chunks summarized in parallel, only 200 counts per chunk come back
+@cached_input
+def processSummaries(file, workers=None):
+    return chunked.map_chunks(file, summarizeRotations, b"\n", workers)
+
+# Joins the chunk summaries in file order, the running dial position
+# carries from one chunk into the next
+def countZeros(file, workers=None):
+    dial = 50
+    count1 = 0
+    count2 = 0
+
+    for net, zeros, passes, above in processSummaries(file, workers):
+        count1 += zeros[-dial % 100]
+        count2 += passes + sum(above[100 - dial:])
+        dial = (dial + net) % 100
+
+    return count1, count2
+
+def part1(file="day1-input.txt"):
 
-    rotations = processInput("day1-input.txt")
+    rotations = processInput(file)
     dial = 50
     count = 0
 
@@ -24,9 +89,36 @@ def part1():
 
     return count
 
-def part2():
+# Closed form: count the zero crossings of each rotation in O(1)
+def part2(file="day1-input.txt"):
+
+    rotations = processInput(file)
+    dial = 50
+    count = 0
+
+    for r in rotations:
+        if r > 0:
+            # zero is reached every 100 clicks to the right
+            count += (dial + r) // 100
+        else:
+            # distance to the first zero going left is dial (or 100 when on zero)
+            count += ((-dial) % 100 - r) // 100
+        dial = (dial + r) % 100
+
+    return count
+
+# Part 1 and 2 from the chunk summaries, without materializing the rotations
+def part1_chunked(file="day1-input.txt"):
+    return countZeros(file)[0]
+
+def part2_chunked(file="day1-input.txt"):
+    return countZeros(file)[1]
+
+# Original solution, step through the rotations click by click
+# O(sum of rotation sizes)
+def part2_og(file="day1-input.txt"):
 
-    rotations = processInput("day1-input.txt")
+    rotations = processInput(file)
     dial = 50
     count = 0
 
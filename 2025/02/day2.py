@@ -1,4 +1,13 @@
+import os
+import sys
+
+ROOT = os.path.normpath(os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", ".."))
+if ROOT not in sys.path:
+    sys.path.append(ROOT)
+from aoc.cache import cached_input
+
 # Pre-Process Input
+@cached_input
 def processInput(file):
 
     input = open(file, "r").read()
@@ -51,9 +60,70 @@ def invalidID_part2(num):
     # No repeating pattern found
     return False
 
+# Sum of all numbers in [start, end] made of a segment of segment_length digits
+# repeated to fill size digits: pattern * (10..010..01), pattern being segment_length digits
+def sumRepeated(start, end, size, segment_length):
+    multiplier = (10 ** size - 1) // (10 ** segment_length - 1)
+    low = max(10 ** (segment_length - 1), -(-start // multiplier))
+    high = min(10 ** segment_length - 1, end // multiplier)
+    if low > high:
+        return 0
+
+    # Arithmetic series low + (low + 1) + ... + high
+    return multiplier * (low + high) * (high - low + 1) // 2
+
+# Mobius function, used to remove IDs counted for more than one segment length
+def mobius(n):
+    result = 1
+    p = 2
+    while p * p <= n:
+        if n % p == 0:
+            n //= p
+            if n % p == 0:
+                return 0
+            result = -result
+        p += 1
+    if n > 1:
+        result = -result
+    return result
+
+# Sum of invalid IDs within [start, end], split by number of digits
+# O(digits^2) per range, independent of the range width
+def sumInvalidIDs(start, end, at_least_twice):
+    total = 0
+    for size in range(len(str(start)), len(str(end)) + 1):
+        low = max(start, 10 ** (size - 1))
+        high = min(end, 10 ** size - 1)
+
+        if not at_least_twice:
+            if size % 2 == 0:
+                total += sumRepeated(low, high, size, size // 2)
+            continue
+
+        # A pattern of length s is also a pattern of every multiple of s,
+        # e.g. 1111 is both 1 x 4 and 11 x 2. Inclusion-exclusion over the
+        # proper divisors counts each ID exactly once.
+        for segment_length in range(1, size // 2 + 1):
+            if size % segment_length == 0:
+                weight = -mobius(size // segment_length)
+                if weight:
+                    total += weight * sumRepeated(low, high, size, segment_length)
+
+    return total
+
 # Part 1
-def part1():
-    id_list = processInput("day2-input.txt")
+def part1(file="day2-input.txt"):
+    id_list = processInput(file)
+    return sum(sumInvalidIDs(start, end, False) for start, end in id_list)
+
+# Part 2
+def part2(file="day2-input.txt"):
+    id_list = processInput(file)
+    return sum(sumInvalidIDs(start, end, True) for start, end in id_list)
+
+# Part 1 - Original Solution, checks every ID in every range
+def part1_og(file="day2-input.txt"):
+    id_list = processInput(file)
     invalidIDs = []
 
     for start, end in id_list:
@@ -63,9 +133,9 @@ def part1():
 
     return sum(invalidIDs)
 
-# Part 2
-def part2():
-    id_list = processInput("day2-input.txt")
+# Part 2 - Original Solution, checks every ID in every range
+def part2_og(file="day2-input.txt"):
+    id_list = processInput(file)
     invalidIDs = []
 
     for start, end in id_list:
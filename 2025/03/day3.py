@@ -1,33 +1,57 @@
+import os
+import sys
+
+ROOT = os.path.normpath(os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", ".."))
+if ROOT not in sys.path:
+    sys.path.append(ROOT)
+from aoc.cache import cached_input
+
 # Pre-Process Input
+@cached_input
 def processInput(file):
     with open(file, "r") as f:
         banks = [line.strip() for line in f.readlines()]
     return banks
 
-# Two pass greedy
-def part1():
-    batteries = processInput("day3-input.txt")
-    joltage = 0
-
-    for bank in batteries:
-        max1 = 0
-        max10 = 0
-        max10pos = 0
-        # First pass, max 10 digit
-        for i in range (len(bank) - 1):
-            if int(bank[i]) > max10:
-                max10 = int(bank[i])
-                max10pos = i
-
-        #Second pass, max 1 digit
-        for i in range(max10pos + 1, len(bank)):
-            # print(i)
-            max1 = max(max1, int(bank[i]))
-
-        # add up
-        joltage += (max10 * 10 + max1)
-
-    return joltage
+# int() of a digit string, k can run into the thousands of digits
+# The conversion limit is only lifted for this call, not for the whole process
+def digitsToInt(digits):
+    limit = sys.get_int_max_str_digits()
+    if not limit or len(digits) <= limit:
+        return int(digits)
+
+    sys.set_int_max_str_digits(0)
+    try:
+        return int(digits)
+    finally:
+        sys.set_int_max_str_digits(limit)
+
+# Largest k-digit number that keeps the digits in bank order
+# Monotonic stack, single pass, O(n)
+def max_joltage(bank, k):
+    digits = bank.encode() if isinstance(bank, str) else bank
+    if not 0 < k <= len(digits):
+        raise ValueError(f"k must be between 1 and the bank length {len(digits)}, got {k}")
+
+    drop = len(digits) - k  # digits we are still allowed to skip
+    stack = bytearray()
+
+    for d in digits:
+        # A bigger digit replaces the smaller ones before it while we can skip them
+        while drop and stack and stack[-1] < d:
+            stack.pop()
+            drop -= 1
+        stack.append(d)
+
+    return digitsToInt(stack[:k])
+
+# Sum of the largest k-digit joltage of every bank
+def total_joltage(banks, k):
+    return sum(max_joltage(bank, k) for bank in banks)
+
+def part1(file="day3-input.txt"):
+    batteries = processInput(file)
+    return total_joltage(batteries, 2)
 
 def main():
     res = part1()
@@ -1,3 +1,19 @@
+import heapq
+import os
+import sys
+import tempfile
+from array import array
+from bisect import bisect_left, bisect_right
+from itertools import islice
+from multiprocessing import shared_memory
+
+ROOT = os.path.normpath(os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", ".."))
+if ROOT not in sys.path:
+    sys.path.append(ROOT)
+from aoc import processes
+from aoc.cache import cached_input
+
+@cached_input
 def processInput(file):
     input = open(file, "r").read()    
     fresh_raw, available_raw = input.split("\n\n")
@@ -6,54 +22,229 @@ def processInput(file):
 
     return fresh, available
 
-# Part 1
-def part1():
-    fresh, available = processInput("day5-input.txt")
+# Read the fresh ranges one at a time, without loading the file
+def iter_fresh(file):
+    with open(file, "r") as f:
+        for line in f:
+            line = line.strip()
+            if not line:
+                break
+            start, end = line.split("-")
+            yield int(start), int(end)
+
+# Merge overlapping and adjacent ranges coming in sorted by start
+# Yields the merged, disjoint ranges as they close
+def iter_merged(sorted_ranges):
+    current = None
+    for start, end in sorted_ranges:
+        if current is None:
+            current = [start, end]
+        # If current range overlaps or is adjacent to last range
+        elif start <= current[1] + 1:
+            # Merge: extend the last range if needed
+            current[1] = max(current[1], end)
+        else:
+            # No overlap, the last range is final
+            yield tuple(current)
+            current = [start, end]
+
+    if current is not None:
+        yield tuple(current)
+
+# Merge overlapping and adjacent ranges, result is sorted and disjoint
+def merge_ranges(ranges):
+    return list(iter_merged(sorted(ranges)))
+
+# Sort ranges that may not fit in memory
+# Sorts chunk_size ranges at a time, spills them to temporary files and merges the files
+def external_sort(ranges, chunk_size=1_000_000):
+    ranges = iter(ranges)
+    chunk = sorted(islice(ranges, chunk_size))
+    if len(chunk) < chunk_size:
+        # Everything fit in one chunk, no need to touch the disk
+        yield from chunk
+        return
+
+    def spill(chunk):
+        f = tempfile.TemporaryFile("w+")
+        f.writelines(f"{start}-{end}\n" for start, end in chunk)
+        f.seek(0)
+        return f
+
+    def read(f):
+        for line in f:
+            start, end = line.split("-")
+            yield int(start), int(end)
+
+    files = []
+    try:
+        while chunk:
+            files.append(spill(chunk))
+            chunk = sorted(islice(ranges, chunk_size))
+        yield from heapq.merge(*(read(f) for f in files))
+    finally:
+        for f in files:
+            f.close()
+
+# Total number of IDs covered by the ranges, streaming
+# O(m log m) time, O(chunk_size) memory
+def union_length(ranges, chunk_size=1_000_000):
+    return sum(end - start + 1 for start, end in iter_merged(external_sort(ranges, chunk_size)))
+
+# Merged fresh ranges, answers membership queries with binary search
+class IntervalIndex:
+    def __init__(self, ranges):
+        merged = merge_ranges(ranges)
+        self.starts = [start for start, _ in merged]
+        self.ends = [end for _, end in merged]
+
+    # O(log m)
+    def __contains__(self, value):
+        # Last range starting at or before value
+        i = bisect_right(self.starts, value) - 1
+        return i >= 0 and value <= self.ends[i]
+
+    # Bulk mode: sort the queries and walk them together with the ranges
+    # O(n log n + m)
+    def count(self, values):
+        starts, ends = self.starts, self.ends
+        i = 0
+        count = 0
+        for value in sorted(values):
+            while i < len(ends) and ends[i] < value:
+                i += 1
+            if i == len(ends):
+                break
+            if starts[i] <= value:
+                count += 1
+
+        return count
+
+def check_range(start, end):
+    if start > end:
+        raise ValueError(f"range start {start} is after its end {end}")
 
-    # Iterate through all ingredients
-    # O(n * m) - number of available * number of fresh ranges
-    count = 0
-    for ingredient in available:
-        if (any(start <= ingredient <= end for start, end in fresh)):
-            count += 1
+# Fresh ranges that change over time, kept merged: sorted, disjoint and not adjacent
+# Ranges merge on insert and split on delete, the index is never rebuilt
+# is_fresh is O(log m) and total_fresh O(1). add_range and remove_range find the
+# touched ranges in O(log m), but splicing the starts and ends lists moves their
+# tails, so an update is O(m) in the worst case (a memmove, cheap next to a rebuild)
+class FreshRanges(IntervalIndex):
+    def __init__(self, ranges=()):
+        super().__init__(ranges)
+        self.total = sum(end - start + 1 for start, end in zip(self.starts, self.ends))
 
-    return count
+    def add_range(self, start, end):
+        check_range(start, end)
+        # Ranges that overlap or touch [start, end]: ends[i] >= start - 1 and starts[j - 1] <= end + 1
+        i = bisect_left(self.ends, start - 1)
+        j = bisect_right(self.starts, end + 1)
+        if i < j:
+            start = min(start, self.starts[i])
+            end = max(end, self.ends[j - 1])
+            self.total -= sum(e - s + 1 for s, e in zip(self.starts[i:j], self.ends[i:j]))
 
-# Part 2 - Original Solution (hangs)
-def part2_og():
-    fresh_ranges, _ = processInput("day5-input.txt")
-    fresh_all = set()
+        self.starts[i:j] = [start]
+        self.ends[i:j] = [end]
+        self.total += end - start + 1
 
-    # O(m * k) - number of fresh ranges * range width
-    for start, end in fresh_ranges:
-        fresh_all.update(range(start, end + 1))
+    def remove_range(self, start, end):
+        check_range(start, end)
+        # Ranges that overlap [start, end]
+        i = bisect_left(self.ends, start)
+        j = bisect_right(self.starts, end)
+        if i >= j:
+            return
 
-    return len(fresh_all)
+        # What is left of the first and last of them, outside [start, end]
+        starts, ends = [], []
+        if self.starts[i] < start:
+            starts.append(self.starts[i])
+            ends.append(start - 1)
+        if self.ends[j - 1] > end:
+            starts.append(end + 1)
+            ends.append(self.ends[j - 1])
+
+        self.total -= sum(e - s + 1 for s, e in zip(self.starts[i:j], self.ends[i:j]))
+        self.total += sum(e - s + 1 for s, e in zip(starts, ends))
+        self.starts[i:j] = starts
+        self.ends[i:j] = ends
+
+    def is_fresh(self, ingredient):
+        return ingredient in self
+
+    # O(1)
+    def total_fresh(self):
+        return self.total
+
+# Worker: attach to the shared int64 arrays and count the fresh IDs in ids[lo:hi]
+def count_shared_slice(names, num_ranges, lo, hi):
+    blocks = [shared_memory.SharedMemory(name=name) for name in names]
+    try:
+        # Every view is released before its block closes, errors included
+        with blocks[0].buf.cast("q") as all_starts, all_starts[:num_ranges] as starts, \
+                blocks[1].buf.cast("q") as all_ends, all_ends[:num_ranges] as ends, \
+                blocks[2].buf.cast("q") as all_ids, all_ids[lo:hi] as ids:
+            count = 0
+            for ingredient in ids:
+                # Last range starting at or before the ingredient
+                i = bisect_right(starts, ingredient) - 1
+                if i >= 0 and ingredient <= ends[i]:
+                    count += 1
+            return count
+    finally:
+        for block in blocks:
+            block.close()
+
+# Merged range bounds and the IDs go to shared memory once, as int64 arrays,
+# workers get only the names and their slice of the IDs, nothing else is pickled
+def count_fresh_parallel(ranges, ingredients, workers=None):
+    index = IntervalIndex(ranges)
+    ingredients = array("q", ingredients)
+    workers = workers or os.cpu_count()
+
+    columns = [array("q", index.starts), array("q", index.ends), ingredients]
+    blocks = [shared_memory.SharedMemory(create=True, size=max(8, len(column) * 8)) for column in columns]
+    try:
+        for block, column in zip(blocks, columns):
+            with block.buf.cast("q") as view:
+                view[:len(column)] = column
+
+        step = -(-len(ingredients) // workers)
+        bounds = [(lo, min(lo + step, len(ingredients))) for lo in range(0, len(ingredients), step or 1)]
+        names = [block.name for block in blocks]
+        with processes.executor(workers) as pool:
+            counts = pool.map(processes.by_path(count_shared_slice), [names] * len(bounds),
+                              [len(index.starts)] * len(bounds), *zip(*bounds))
+            return sum(counts)
+    finally:
+        for block in blocks:
+            block.close()
+            block.unlink()
+
+# Part 1
+def part1(file="day5-input.txt"):
+    fresh, available = processInput(file)
+
+    # O(m log m + n log n) - merge the ranges once, then one pass over the sorted ingredients
+    return IntervalIndex(fresh).count(available)
+
+# Part 1 - ingredient checks fanned out over all cores
+def part1_parallel(file="day5-input.txt"):
+    fresh, available = processInput(file)
+    return count_fresh_parallel(fresh, available)
+
+# Part 2 - Streaming: the ranges are never all in memory at once
+def part2(file="day5-input.txt"):
+    return union_length(iter_fresh(file))
 
 # Part 2 - Alternative 4: Interval Merging (Most Efficient for Large Ranges)
 # Resorted to cursor's suggestion
-def part2_alt():
-    fresh_ranges, _ = processInput("day5-input.txt")
-    
-    # Sort ranges by start value
-    sorted_ranges = sorted(fresh_ranges)
-    
-    if not sorted_ranges:
-        return 0
-    
-    # Merge overlapping intervals
-    merged = [sorted_ranges[0]]
-    for start, end in sorted_ranges[1:]:
-        last_start, last_end = merged[-1]
-        
-        # If current range overlaps or is adjacent to last range
-        if start <= last_end + 1:
-            # Merge: extend the last range if needed
-            merged[-1] = (last_start, max(last_end, end))
-        else:
-            # No overlap, add as new range
-            merged.append((start, end))
+def part2_alt(file="day5-input.txt"):
+    fresh_ranges, _ = processInput(file)
     
+    merged = merge_ranges(fresh_ranges)
+
     # Calculate total from merged ranges
     total = sum(end - start + 1 for start, end in merged)
     return total
@@ -62,7 +253,7 @@ def main():
     fresh_ingredients = part1()
     print("Part 1:", fresh_ingredients)
 
-    fresh_ingredients = part2_alt()
+    fresh_ingredients = part2()
     print("Part 2:", fresh_ingredients)
 
 if __name__ == "__main__":
@@ -1,43 +1,106 @@
+import mmap
+import os
 import sys
+from math import prod
 
+ROOT = os.path.normpath(os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", ".."))
+if ROOT not in sys.path:
+    sys.path.append(ROOT)
+from aoc.cache import cached_input
+
+# Columnar loader: numeric rows parsed straight to ints, operator row kept apart
+@cached_input
 def processInput(file):
     with open(file, "r") as f:
-        lines = [line.strip() for line in f.readlines()]
-
-    column_data = [line.split() for line in lines]
+        lines = f.read().split("\n")
 
-    return column_data
+    lines = [line for line in lines if line.strip()]
+    rows = [list(map(int, line.split())) for line in lines[:-1]]
+    operations = lines[-1].split()
 
-def part1():
-    columns_data = processInput("day6-input.txt")
-    num_columns = len(columns_data[0])
+    return rows, operations
 
+# Grand total of all problems: a product or a sum down each column
+# Python ints are exact, so large products never overflow
+def evaluate(rows, operations):
     result_all = 0
-    # For each column index:
-    for col_idx in range(num_columns):
-        numbers = []
-        for row in columns_data[:-1]:  # All except last row
-            numbers.append(int(row[col_idx]))
-        
-        operation = columns_data[-1][col_idx]  # Last row
-
-        # Calculate: multiply or add
-        if operation == '*':
-            result = 1
-            for number in numbers:
-                result *= number 
-        else:
-            # result = sum of all numbers
-            result = 0
-            result = sum(numbers)
-
-        result_all += result
+    for operation, numbers in zip(operations, zip(*rows)):
+        result_all += prod(numbers) if operation == '*' else sum(numbers)
 
     return result_all
 
-def part2():
-    
-    return
+def part1(file="day6-input.txt"):
+    rows, operations = processInput(file)
+    return evaluate(rows, operations)
+
+# Maps spaces to zero bytes, so a column is blank when it ORs to zero
+BLANK = bytes.maketrans(b" ", b"\0")
+
+# Column spans [start, end) of the problems in a block of equal width rows
+# Problems are separated by columns of only spaces
+def problemSpans(rows):
+    width = len(rows[0])
+    mask = 0
+    for row in rows:
+        mask |= int.from_bytes(row.translate(BLANK), "big")
+    occupied = mask.to_bytes(width, "big")
+
+    spans = []
+    pos = 0
+    for piece in occupied.split(b"\0"):
+        if piece:
+            spans.append((pos, pos + len(piece)))
+        pos += len(piece) + 1
+
+    return spans
+
+# Memory-mapped character grid, whitespace kept, streamed block_width columns at a time
+# Yields each problem as its rows, all cut to the same width
+def iterProblems(file, block_width=1 << 20):
+    with open(file, "rb") as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as grid:
+        # Start and end offset of every line
+        lines = []
+        pos = 0
+        while pos < len(grid):
+            end = grid.find(b"\n", pos)
+            if end == -1:
+                end = len(grid)
+            if end > pos:
+                lines.append((pos, end))
+            pos = end + 1
+        width = max(end - start for start, end in lines)
+
+        # Columns of a problem that runs past the end of the previous block
+        carry = [b""] * len(lines)
+        for block_start in range(0, width, block_width):
+            block_end = min(block_start + block_width, width)
+            size = len(carry[0]) + block_end - block_start
+            rows = [
+                (prefix + grid[start + block_start:min(start + block_end, end)]).ljust(size)
+                for prefix, (start, end) in zip(carry, lines)
+            ]
+
+            spans = problemSpans(rows)
+            carry = [b""] * len(lines)
+            if block_end < width and spans and spans[-1][1] == size:
+                last_start, _ = spans.pop()
+                carry = [row[last_start:] for row in rows]
+
+            for start, end in spans:
+                yield [row[start:end] for row in rows]
+
+# Cephalopod math, numbers are read top to bottom, one per column
+# The order of the columns doesn't change a sum or a product
+def part2(file="day6-input.txt"):
+    result_all = 0
+    for problem in iterProblems(file):
+        *digit_rows, operation = problem
+        # Spaces inside a column are skipped, the digits still read top to bottom
+        columns = (bytes(column).translate(None, b" ") for column in zip(*digit_rows))
+        numbers = [int(column) for column in columns if column]
+        result_all += prod(numbers) if b"*" in operation else sum(numbers)
+
+    return result_all
 
 def main():
     result = part1()
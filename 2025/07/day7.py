@@ -1,3 +1,12 @@
+import os
+import sys
+
+ROOT = os.path.normpath(os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", ".."))
+if ROOT not in sys.path:
+    sys.path.append(ROOT)
+from aoc.cache import cached_input
+
+@cached_input
 def processInput(file):
     with open(file, "r") as f:
         lines = [line.strip() for line in f.readlines()]
@@ -7,104 +16,137 @@ def processInput(file):
     
     return data
 
-def part1():
-    data = processInput("day7-input.txt")
+# Row as a bitmask of its splitters, bit i is column i
+SPLITTER_BITS = str.maketrans("^.S|", "1000")
 
-    # Start the beam, find the position of S in the first row
-    start_row = data[0]
-    start_pos = 0
-    for pos in range(len(start_row)):
-        if start_row[pos] == 'S':
-            start_pos = pos
-            break
+def splitterMask(row):
+    return int("".join(row)[::-1].translate(SPLITTER_BITS), 2)
 
-    # Mark the beam in the second row
-    data[1][start_pos] = '|'
+def part1(file="day7-input.txt"):
+    """
+    Beams and splitters of a row are bitmasks, so every row step is a few
+    big-int operations: the beams that hit a splitter go one column left and right,
+    all others continue straight down.
+    """
+    data = processInput(file)
 
-    # O(n * m)
-    # Start from the second row
-    num_rows = len(data)
     num_cols = len(data[0])
+    all_cols = (1 << num_cols) - 1
+
+    # Start the beam at the position of S in the first row
+    beams = 1 << data[0].index('S')
+
+    # O(n * m / 64)
     split_count = 0
-    for row in range(1, num_rows - 1):
-        for col in range(num_cols):
-            if data[row][col] == '|':
-                # follow the beam, see if it's followed by a split
-                if data[row + 1][col] == '^':
-                    # split, mark the split ray in next row
-                    if col > 0:
-                        data[row + 1][col - 1] = '|'
-                    if col < num_cols - 1:
-                        data[row + 1][col + 1] = '|'
-                    split_count += 1
-                else:
-                    # no split, continiue the ray
-                    data[row + 1][col] = '|'
+    for row in data[1:]:
+        splitters = splitterMask(row)
+        hits = beams & splitters
+        split_count += hits.bit_count()
+        beams = ((beams & ~splitters) | (hits << 1) | (hits >> 1)) & all_cols
 
     return split_count
 
-def part2():
+# One row step of the timeline counts, shared by part2 and sweep
+# Returns the counts for this row and how many beams hit a splitter
+def stepTimelines(row, counts, num_cols):
+    # Accumulate counts for this row (merging happens automatically via +=)
+    next_counts = {}
+    hits = 0
+    for col, count in counts.items():
+        if row[col] == '^':
+            # Splitter: count goes to both left and right positions
+            hits += 1
+            if col > 0:
+                next_counts[col - 1] = next_counts.get(col - 1, 0) + count
+            if col < num_cols - 1:
+                next_counts[col + 1] = next_counts.get(col + 1, 0) + count
+        else:
+            # Empty space ('.'): count continues straight down
+            next_counts[col] = next_counts.get(col, 0) + count
+
+    return next_counts, hits
+
+def part2(file="day7-input.txt"):
     """ 
     Each path carries with it the count of different routes you can take to get there.
     Start from S with 1. Each time paths merge, sum their counts.
     Each time they split, put the count on both sides.
+    Only the current row is kept, as a dict of the columns that hold a beam.
     """
-    data = processInput("day7-input.txt")
-    
-    num_rows = len(data)
+    data = processInput(file)
+
     num_cols = len(data[0])
-    
-    # Find starting position
-    start_pos = 0
-    for pos in range(len(data[0])):
-        if data[0][pos] == 'S':
-            start_pos = pos
-            break
-    
-    # Initialize counts array: same dimensions as data, all zeros
-    counts = [[0] * num_cols for _ in range(num_rows)]
-    
-    # Initialize: start position has count 1
-    counts[0][start_pos] = 1
-    
+
+    # Start position has count 1
+    counts = {data[0].index('S'): 1}
+
     # Process each row from top to bottom
-    for row in range(num_rows - 1):
-        next_row = row + 1
-        # Temporary array to accumulate counts for next row
-        next_counts = [0] * num_cols
-        
-        # For each position in current row that has a count
-        for col in range(num_cols):
-            if counts[row][col] > 0:
-                count = counts[row][col]
-                
-                # Check what's in the next row at this column
-                if next_row < num_rows:
-                    if data[next_row][col] == '^':
-                        # Splitter: count goes to both left and right positions
-                        if col > 0:
-                            next_counts[col - 1] += count
-                        if col < num_cols - 1:
-                            next_counts[col + 1] += count
-                    else:
-                        # Empty space ('.'): count continues straight down
-                        next_counts[col] += count
-        
-        # Update counts for next row (merging happens automatically via +=)
-        for col in range(num_cols):
-            counts[next_row][col] = next_counts[col]
-    
+    # O(n * beams) time, O(beams) memory
+    for row in data[1:]:
+        counts, _ = stepTimelines(row, counts, num_cols)
+
     # Sum all counts in the last row (all possible timelines)
-    total_timelines = sum(counts[num_rows - 1])
-        
+    total_timelines = sum(counts.values())
+
     return total_timelines
 
+def sweep(file="day7-input.txt"):
+    """
+    Both parts in one top to bottom pass, the grid is streamed from the file
+    one row at a time. Only the columns holding a beam are visited: the number
+    of them that hit a splitter is the split count, and the counts they carry
+    are the timelines.
+    """
+    with open(file, "r") as f:
+        first_row = f.readline().strip()
+        num_cols = len(first_row)
+
+        # Start position has count 1
+        counts = {first_row.index('S'): 1}
+        split_count = 0
+
+        # O(n * beams) time, O(m) memory
+        for line in f:
+            row = line.strip()
+            if not row:
+                continue
+
+            counts, hits = stepTimelines(row, counts, num_cols)
+            split_count += hits
+
+    return split_count, sum(counts.values())
+
+# Timeline counts for every possible start column of row 0, from one bottom-up sweep
+# O(n * m) once, then O(1) per query
+class TimelineMatrix:
+    def __init__(self, data):
+        num_cols = len(data[0])
+
+        # A beam on the last row is a single timeline
+        ways = [1] * num_cols
+
+        # ways[col] is the count for a beam in the row above `row`
+        for row in reversed(data[1:]):
+            ways = [
+                ((ways[col - 1] if col > 0 else 0) + (ways[col + 1] if col < num_cols - 1 else 0))
+                if row[col] == '^' else ways[col]
+                for col in range(num_cols)
+            ]
+
+        self.ways = ways
+
+    def timelines_from(self, col):
+        return self.ways[col]
+
+# Part 2 - Alternative: bottom-up, answers for any start column
+def part2_reverse(file="day7-input.txt"):
+    data = processInput(file)
+    return TimelineMatrix(data).timelines_from(data[0].index('S'))
+
 def main():
-    result = part1()
-    print("Part 1:", result)
-    
-    result = part2()
-    print("Part 2:", result)
+    split_count, total_timelines = sweep()
+    print("Part 1:", split_count)
+    print("Part 2:", total_timelines)
 
 if __name__ == "__main__":
     main()
@@ -0,0 +1,164 @@
+"""
+Command line entry point.
+
+    python -m aoc list
+    python -m aoc run 2025 7 [--part 2] [--input FILE]
+    python -m aoc bench 2025 7 [--part 2] [--input FILE] [--repeat 20]
+    python -m aoc all [--jobs N]
+    python -m aoc generate 2025 5 OUTPUT [--scale 10] [--seed 0]
+    python -m aoc scale 2025 5 [--scales 1 2 4 8] [--part 2] [--csv]
+    python -m aoc mem 2025 5 [--part 2] [--input FILE] [--budget MB] [--top 5]
+    python -m aoc check [--tolerance 50] [--repeat 5] [--only 2025/5] [--update]
+"""
+import argparse
+import json
+import os
+import sys
+import time
+
+from aoc import generate, memory, regression, runner, schedule
+
+def ms(ns):
+    return f"{ns / 1e6:.3f} ms"
+
+def cmd_list(args):
+    for (year, day), path in runner.find_solvers().items():
+        print(year, day, os.path.relpath(path, runner.ROOT))
+
+def cmd_run(args):
+    path = runner.solver_path(args.year, args.day)
+    module = runner.load_solver(path)
+    file = args.input or runner.default_input(path)
+
+    answers, timings = runner.run_solver(module, file, args.part)
+    if "parse" in timings:
+        print(f"parse: {ms(timings['parse'])}")
+    for name, answer in answers.items():
+        print(f"{name}: {answer}  ({ms(timings[name])})")
+
+def cmd_bench(args):
+    path = runner.solver_path(args.year, args.day)
+    module = runner.load_solver(path)
+    file = args.input or runner.default_input(path)
+
+    report = runner.bench_solver(module, file, args.part, args.repeat)
+    result = {"year": args.year, "day": args.day, "input": file, "repeat": args.repeat, "ns": report}
+    json.dump(result, sys.stdout, indent=2)
+    print()
+
+def cmd_all(args):
+    start = time.perf_counter_ns()
+    results = schedule.run_all(max_workers=args.jobs)
+    for (year, day, name, _), answer, ns in results:
+        print(f"{year} day {day} {name}: {answer}  ({ms(ns)})")
+    print(f"wall clock: {ms(time.perf_counter_ns() - start)}")
+
+def cmd_generate(args):
+    size = generate.write_input(args.year, args.day, args.output, args.scale, args.seed)
+    print(f"{args.output}: {size} bytes")
+
+def cmd_scale(args):
+    rows = generate.scaling(args.year, args.day, args.scales, args.part, args.seed)
+    if args.csv:
+        print("scale,bytes,part,ns,peak_bytes")
+        for row in rows:
+            print(",".join(map(str, row)))
+        return
+
+    # Text plot: one bar for the time, one for the memory, relative to the largest
+    slowest = max(ns for *_, ns, _ in rows) or 1
+    biggest = max(peak for *_, peak in rows) or 1
+    for scale, size, name, ns, peak in rows:
+        time_bar = "#" * round(30 * ns / slowest)
+        memory_bar = "=" * round(30 * peak / biggest)
+        print(f"x{scale:<4} {size:>12} B  {name:<9} {ms(ns):>14} {time_bar:<30}"
+              f" {peak / 1e6:>10.2f} MB {memory_bar}")
+
+def cmd_mem(args):
+    path = runner.solver_path(args.year, args.day)
+    file = args.input or runner.default_input(path)
+
+    over_budget = []
+    for name, (answer, report) in memory.profile_solver(path, file, args.part, args.top).items():
+        print(f"{name}: {answer}")
+        print(f"  tracemalloc peak: {report['peak'] / 1e6:.2f} MB")
+        print(f"  peak RSS growth:  {report['rss_delta'] / 1e6:.2f} MB")
+        for site in report["sites"]:
+            print(f"    {site['bytes'] / 1e6:>8.2f} MB  {site['site']}")
+        if args.budget is not None and report["peak"] > args.budget * 1e6:
+            over_budget.append(name)
+
+    if over_budget:
+        sys.exit(f"Over the {args.budget} MB budget: {', '.join(over_budget)}")
+
+def cmd_check(args):
+    failures = []
+    for key, answer, ns, failure in regression.check(args.tolerance / 100, args.repeat, args.update, args.only):
+        print(f"{key}: {answer}  ({ms(ns)}){'  FAIL: ' + failure if failure else ''}")
+        if failure:
+            failures.append(key)
+
+    if failures:
+        sys.exit(f"{len(failures)} regression(s): {', '.join(failures)}")
+
+def add_solver_args(parser):
+    parser.add_argument("year", type=int)
+    parser.add_argument("day", type=int)
+    parser.add_argument("--part", action="append",
+                        help="1, 2 or an alternative such as 2_og; repeat for several, default all")
+    parser.add_argument("--input", help="input file, default the dayN-input.txt next to the solver")
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(prog="python -m aoc")
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    commands.add_parser("list", help="list the solvers").set_defaults(func=cmd_list)
+
+    run = commands.add_parser("run", help="solve one day, with timings")
+    add_solver_args(run)
+    run.set_defaults(func=cmd_run)
+
+    bench = commands.add_parser("bench", help="repeat runs, report min/median/p95 as JSON")
+    add_solver_args(bench)
+    bench.add_argument("--repeat", type=int, default=10)
+    bench.set_defaults(func=cmd_bench)
+
+    run_all = commands.add_parser("all", help="run every day and part on a process pool")
+    run_all.add_argument("--jobs", type=int, help="worker processes, default one per core")
+    run_all.set_defaults(func=cmd_all)
+
+    gen = commands.add_parser("generate", help="write a synthetic input")
+    gen.add_argument("year", type=int)
+    gen.add_argument("day", type=int)
+    gen.add_argument("output")
+    gen.add_argument("--scale", type=int, default=1)
+    gen.add_argument("--seed", type=int, default=0)
+    gen.set_defaults(func=cmd_generate)
+
+    scale = commands.add_parser("scale", help="time and memory against generated input size")
+    scale.add_argument("year", type=int)
+    scale.add_argument("day", type=int)
+    scale.add_argument("--scales", type=int, nargs="+", default=[1, 2, 4, 8])
+    scale.add_argument("--part", action="append", help="1, 2 or an alternative such as 2_og")
+    scale.add_argument("--seed", type=int, default=0)
+    scale.add_argument("--csv", action="store_true", help="print CSV instead of the text plot")
+    scale.set_defaults(func=cmd_scale)
+
+    mem = commands.add_parser("mem", help="tracemalloc peak, top allocation sites and RSS growth")
+    add_solver_args(mem)
+    mem.add_argument("--budget", type=float, help="fail when a part's tracemalloc peak is over this many MB")
+    mem.add_argument("--top", type=int, default=5, help="allocation sites to show")
+    mem.set_defaults(func=cmd_mem)
+
+    check = commands.add_parser("check", help="compare answers and timings against the stored baselines")
+    check.add_argument("--tolerance", type=float, default=50, help="allowed slowdown in percent")
+    check.add_argument("--repeat", type=int, default=5)
+    check.add_argument("--only", help="only keys starting with this, e.g. 2025/5")
+    check.add_argument("--update", action="store_true", help="store the new answers and timings as baselines")
+    check.set_defaults(func=cmd_check)
+
+    args = parser.parse_args(argv)
+    args.func(args)
+
+if __name__ == "__main__":
+    main()
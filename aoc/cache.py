@@ -0,0 +1,150 @@
+"""
+Parse-once cache for puzzle inputs.
+
+Decorate a processInput(file) function with @cached_input and every call
+after the first one returns the already parsed input:
+
+- in memory, keyed by (parser, path, mtime, size), with LRU eviction
+- on disk, as a pickle keyed by a hash of the file contents, the solver's
+  whole source file and the aoc package sources, so a new run of the same
+  solver skips parsing entirely, and any change to the parser or to a
+  helper it calls starts over. A new pickle replaces the older ones of the
+  same parser and input file, and past MAX_DISK_ENTRIES the least recently
+  used pickles are deleted
+
+Keyword arguments (e.g. workers=4) reach the parser but are not part of
+the key, so they must not change the parsed result.
+
+The cached value is shared between callers, so solvers must not modify it.
+Set AOC_DISK_CACHE=0 to turn off the on-disk cache.
+"""
+import functools
+import hashlib
+import os
+import pickle
+from collections import OrderedDict
+
+CACHE_DIR = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), ".aoc-cache")
+MAX_ENTRIES = 16
+MAX_DISK_ENTRIES = 64
+
+# Inspect after a run to see how the cache did
+stats = {"hits": 0, "disk_hits": 0, "misses": 0}
+
+_memory = OrderedDict()
+
+def disk_enabled():
+    return os.environ.get("AOC_DISK_CACHE", "1") != "0"
+
+def clear(disk=False):
+    _memory.clear()
+    for key in stats:
+        stats[key] = 0
+    if disk and os.path.isdir(CACHE_DIR):
+        for name in os.listdir(CACHE_DIR):
+            os.remove(os.path.join(CACHE_DIR, name))
+
+AOC_DIR = os.path.dirname(os.path.abspath(__file__))
+
+def hash_file(digest, path):
+    with open(path, "rb") as f:
+        for block in iter(lambda: f.read(1 << 20), b""):
+            digest.update(block)
+
+# Hash of the input file and of all the code a parse can run: the whole solver
+# module, helpers and constants included, and the shared aoc modules (e.g. chunked)
+def content_key(parse, path, args):
+    digest = hashlib.sha256()
+    digest.update(repr((parse.__qualname__, args)).encode())
+    sources = [parse.__code__.co_filename]
+    sources += sorted(os.path.join(AOC_DIR, name) for name in os.listdir(AOC_DIR) if name.endswith(".py"))
+    for source in sources:
+        hash_file(digest, source)
+    hash_file(digest, path)
+    return digest.hexdigest()
+
+# Same for every version of the parser and of the input file, so a new
+# pickle can find and replace the stale ones
+def slot_key(parse, path, args):
+    slot = repr((parse.__code__.co_filename, parse.__qualname__, path, args))
+    return hashlib.sha256(slot.encode()).hexdigest()[:16]
+
+def load_disk(name):
+    target = os.path.join(CACHE_DIR, name)
+    try:
+        with open(target, "rb") as f:
+            value = pickle.load(f)
+        # Recently used, for prune_disk
+        os.utime(target)
+        return True, value
+    except (OSError, pickle.UnpicklingError, EOFError):
+        return False, None
+
+def store_disk(name, value):
+    os.makedirs(CACHE_DIR, exist_ok=True)
+    target = os.path.join(CACHE_DIR, name)
+    # Write then rename, so a concurrent reader never sees half a pickle
+    tmp = f"{target}.{os.getpid()}.tmp"
+    with open(tmp, "wb") as f:
+        pickle.dump(value, f, protocol=pickle.HIGHEST_PROTOCOL)
+    os.replace(tmp, target)
+    prune_disk(name)
+
+# Drops the older pickles of the same slot as name, then the least recently
+# used ones past MAX_DISK_ENTRIES
+def prune_disk(name):
+    slot = name.split("-")[0]
+    entries = []
+    for entry in os.scandir(CACHE_DIR):
+        if not entry.name.endswith(".pickle") or entry.name == name:
+            continue
+        try:
+            if entry.name.startswith(slot + "-"):
+                os.remove(entry.path)
+            else:
+                entries.append((entry.stat().st_mtime_ns, entry.path))
+        except OSError:
+            # Already gone, another run pruned it first
+            pass
+
+    entries.sort(reverse=True)
+    for _, path in entries[MAX_DISK_ENTRIES - 1:]:
+        try:
+            os.remove(path)
+        except OSError:
+            pass
+
+# Positional arguments after the file are part of the key, keyword arguments
+# are passed through but not keyed: they are for options that don't change
+# the result, such as the number of workers
+def cached_input(parse):
+    @functools.wraps(parse)
+    def wrapper(file, *args, **options):
+        path = os.path.abspath(file)
+        st = os.stat(path)
+        key = (parse.__code__.co_filename, parse.__qualname__, path, st.st_mtime_ns, st.st_size, args)
+
+        if key in _memory:
+            stats["hits"] += 1
+            _memory.move_to_end(key)
+            return _memory[key]
+
+        found = False
+        if disk_enabled():
+            name = f"{slot_key(parse, path, args)}-{content_key(parse, path, args)}.pickle"
+            found, value = load_disk(name)
+
+        if found:
+            stats["disk_hits"] += 1
+        else:
+            stats["misses"] += 1
+            value = parse(file, *args, **options)
+            if disk_enabled():
+                store_disk(name, value)
+
+        _memory[key] = value
+        if len(_memory) > MAX_ENTRIES:
+            _memory.popitem(last=False)
+        return value
+
+    return wrapper
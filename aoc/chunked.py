@@ -0,0 +1,59 @@
+"""
+Parallel parsing of large line-oriented inputs.
+
+The file is memory-mapped and cut into chunks right after a separator
+(a newline, or a blank line when records span several lines), so no line
+or record is ever split between two chunks. Every chunk is parsed in a
+worker process that maps the file itself, so only the offsets and the
+parsed results cross process boundaries. Results come back in file order,
+ready to be joined by the caller.
+
+Files under PARALLEL_MIN bytes are parsed in-process, as a single chunk.
+"""
+import mmap
+import os
+from functools import partial
+
+from aoc import processes
+
+PARALLEL_MIN = 8 << 20
+CHUNK_SIZE = 64 << 20
+
+# (start, end) offsets of about `chunks` chunks, each ending right after a separator
+def boundaries(data, separator, chunks):
+    size = len(data)
+    cuts = [0]
+    for i in range(1, chunks):
+        found = data.find(separator, max(size * i // chunks, cuts[-1]))
+        if found == -1:
+            break
+        cut = found + len(separator)
+        if cut > cuts[-1]:
+            cuts.append(cut)
+    if cuts[-1] < size:
+        cuts.append(size)
+    return list(zip(cuts, cuts[1:]))
+
+def parse_chunk(parse, path, start, end):
+    with open(path, "rb") as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as data:
+        return parse(data[start:end])
+
+def map_chunks(path, parse, separator=b"\n", workers=None):
+    """
+    parse(bytes) applied to every chunk of the file, results in file order.
+    parse must be a module-level function (or a partial of one) so it can be pickled,
+    solver functions are sent by path and work with every start method.
+    """
+    workers = workers or os.cpu_count()
+    size = os.path.getsize(path)
+    if size < PARALLEL_MIN or workers == 1:
+        with open(path, "rb") as f:
+            return [parse(f.read())]
+
+    chunks = max(workers, -(-size // CHUNK_SIZE))
+    with open(path, "rb") as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as data:
+        bounds = boundaries(data, separator, chunks)
+
+    starts, ends = zip(*bounds)
+    with processes.executor(workers) as pool:
+        return list(pool.map(partial(parse_chunk, processes.by_path(parse), path), starts, ends))
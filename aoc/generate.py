@@ -0,0 +1,172 @@
+"""
+Synthetic inputs for stress testing the solvers.
+
+There is one generator per day. Each takes a seeded random.Random and a
+scale factor and yields the input text piece by piece, so write_input can
+stream files of any size to disk. Scale 1 is about the size of the real
+puzzle input.
+"""
+import os
+import random
+import string
+import tempfile
+import time
+import tracemalloc
+
+from aoc import runner
+
+ITEMS = string.ascii_lowercase + string.ascii_uppercase
+
+# 2022/1: 250 * scale elves, a blank line between elves
+def calories(rng, scale):
+    for elf in range(250 * scale):
+        if elf:
+            yield "\n"
+        for _ in range(rng.randint(1, 12)):
+            yield f"{rng.randint(1000, 60000)}\n"
+
+# 2022/2: 2500 * scale rounds
+def strategy_guide(rng, scale):
+    for _ in range(2500 * scale):
+        yield f"{rng.choice('ABC')} {rng.choice('XYZ')}\n"
+
+# 2022/3: 100 * scale groups of 3 rucksacks
+# The halves of a rucksack share one item, the 3 rucksacks of a group share only the badge
+def rucksacks(rng, scale):
+    for _ in range(100 * scale):
+        items = list(ITEMS)
+        rng.shuffle(items)
+        badge, items = items[0], items[1:]
+        for pool in (items[:17], items[17:34], items[34:]):
+            shared, left, right = pool[0], pool[1:9], pool[9:]
+            size = rng.randint(4, 24)
+            first = [badge, shared] + rng.choices(left, k=size - 2)
+            second = [shared] + rng.choices(right, k=size - 1)
+            rng.shuffle(first)
+            rng.shuffle(second)
+            yield "".join(first + second) + "\n"
+
+# 2022/4: 1000 * scale pairs of sections between 1 and 99 * scale
+def section_pairs(rng, scale):
+    top = 99 * scale
+    for _ in range(1000 * scale):
+        a, b = sorted(rng.randint(1, top) for _ in range(2))
+        c, d = sorted(rng.randint(1, top) for _ in range(2))
+        yield f"{a}-{b},{c}-{d}\n"
+
+# 2025/1: 4000 rotations of up to 1000 * scale clicks
+def rotations(rng, scale):
+    for _ in range(4000):
+        yield f"{rng.choice('LR')}{rng.randint(1, 1000 * scale)}\n"
+
+# 2025/2: 30 ranges, 10^5 * scale wide, on one line
+def id_ranges(rng, scale):
+    for i in range(30):
+        start = rng.randint(1, 10 ** rng.randint(2, 10))
+        yield f"{',' if i else ''}{start}-{start + rng.randint(0, 100000 * scale)}"
+    yield "\n"
+
+# 2025/3: 200 banks of 100 * scale digits
+def battery_banks(rng, scale):
+    for _ in range(200):
+        for _ in range(scale):
+            yield "".join(rng.choices("123456789", k=100))
+        yield "\n"
+
+# 2025/5: 180 * scale fresh ranges, 1000 * scale ingredients, IDs up to 10^14
+def ingredients(rng, scale):
+    for _ in range(180 * scale):
+        start = rng.randint(1, 10 ** 14)
+        yield f"{start}-{start + rng.randint(0, 10 ** 12)}\n"
+    yield "\n"
+    for _ in range(1000 * scale):
+        yield f"{rng.randint(1, 10 ** 14)}\n"
+
+# 2025/6: 1000 * scale problems of 4 numbers
+# Written cell by cell, the problems are generated again from the seed for every row
+def worksheet(rng, scale):
+    seed = rng.random()
+    for row in range(5):
+        problems = random.Random(seed)
+        separator = ""
+        for _ in range(1000 * scale):
+            numbers = [str(problems.randint(1, 9999)) for _ in range(4)]
+            operation = problems.choice("+*")
+            width = max(map(len, numbers))
+            right = problems.random() < 0.5
+            if row < 4:
+                cell = numbers[row].rjust(width) if right else numbers[row].ljust(width)
+            else:
+                cell = operation.ljust(width)
+            # One cell at a time, a row is never held in memory
+            yield separator + cell
+            separator = " "
+        yield "\n"
+
+# 2025/7: 142 rows, 141 * scale columns, splitters on every other row
+def manifold(rng, scale):
+    width = 141 * scale
+    row = ["."] * width
+    row[width // 2] = "S"
+    yield "".join(row) + "\n"
+    for r in range(1, 142):
+        row = ["."] * width
+        if r % 2 == 0:
+            for col in range(width):
+                if rng.random() < 0.3 and (col == 0 or row[col - 1] != "^"):
+                    row[col] = "^"
+        yield "".join(row) + "\n"
+
+GENERATORS = {
+    (2022, 1): calories,
+    (2022, 2): strategy_guide,
+    (2022, 3): rucksacks,
+    (2022, 4): section_pairs,
+    (2025, 1): rotations,
+    (2025, 2): id_ranges,
+    (2025, 3): battery_banks,
+    (2025, 5): ingredients,
+    (2025, 6): worksheet,
+    (2025, 7): manifold,
+}
+
+# Streams the generated input to path, 1 MB at a time, returns its size in bytes
+def write_input(year, day, path, scale=1, seed=0):
+    generator = GENERATORS[(year, day)](random.Random(seed), scale)
+    buffer = []
+    buffered = 0
+    with open(path, "w") as f:
+        for piece in generator:
+            buffer.append(piece)
+            buffered += len(piece)
+            if buffered >= 1 << 20:
+                f.write("".join(buffer))
+                buffer, buffered = [], 0
+        f.write("".join(buffer))
+    return os.path.getsize(path)
+
+# Time and tracemalloc peak of parse + each part, for every scale
+# Timed without tracemalloc, which slows everything down, then run again for the peak
+# Returns rows of (scale, input bytes, part, ns, peak bytes)
+def scaling(year, day, scales, parts=None, seed=0, directory=None):
+    path = runner.solver_path(year, day)
+    module = runner.load_solver(path)
+    rows = []
+    for scale in scales:
+        file = os.path.join(directory or tempfile.gettempdir(), f"aoc-{year}-{day}-x{scale}.txt")
+        size = write_input(year, day, file, scale, seed)
+        try:
+            for name in runner.part_names(module, parts):
+                part = [name[len("part"):]]
+                start = time.perf_counter_ns()
+                runner.run_solver(module, file, part)
+                ns = time.perf_counter_ns() - start
+
+                tracemalloc.start()
+                runner.run_solver(module, file, part)
+                _, peak = tracemalloc.get_traced_memory()
+                tracemalloc.stop()
+                rows.append((scale, size, name, ns, peak))
+        finally:
+            os.remove(file)
+    return rows
@@ -0,0 +1,80 @@
+"""
+Memory profiling of the solvers.
+
+profile() wraps one call and records:
+
+- the tracemalloc peak, the most Python heap the call held at once
+- the allocation sites holding the most memory close to that peak
+- the growth of the process peak RSS during the call
+
+Each part runs in a fresh worker process, so the RSS is not polluted by
+earlier runs. The input cache is cleared first, so parsing is included.
+"""
+import gc
+import os
+import resource
+import sys
+import tracemalloc
+from concurrent.futures import ProcessPoolExecutor
+
+from aoc import cache, runner
+
+# Snapshot again when the traced memory is this much above the last snapshot
+SNAPSHOT_GROWTH = 1.1
+
+def max_rss():
+    # KB on Linux, bytes on macOS
+    rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return rss if sys.platform == "darwin" else rss * 1024
+
+def profile(func, *args, top=5):
+    """Calls func(*args), returns its result and a report of its memory use."""
+    gc.collect()
+    rss_before = max_rss()
+    snapshot = None
+    snapshot_size = 0
+
+    # tracemalloc only keeps the peak size, not where it was allocated,
+    # so take a snapshot whenever a function returns at a new high
+    def on_event(frame, event, arg):
+        nonlocal snapshot, snapshot_size
+        if event in ("return", "c_return"):
+            current, _ = tracemalloc.get_traced_memory()
+            if current > snapshot_size * SNAPSHOT_GROWTH:
+                snapshot = tracemalloc.take_snapshot()
+                snapshot_size = current
+
+    tracemalloc.start()
+    sys.setprofile(on_event)
+    try:
+        result = func(*args)
+    finally:
+        sys.setprofile(None)
+        _, peak = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+
+    sites = []
+    if snapshot is not None:
+        snapshot = snapshot.filter_traces([tracemalloc.Filter(False, tracemalloc.__file__)])
+        for stat in snapshot.statistics("lineno")[:top]:
+            frame = stat.traceback[0]
+            sites.append({"site": f"{os.path.relpath(frame.filename, runner.ROOT)}:{frame.lineno}",
+                          "bytes": stat.size})
+
+    report = {"peak": peak, "rss_delta": max_rss() - rss_before, "sites": sites}
+    return result, report
+
+def profile_part(path, file, name, top=5):
+    module = runner.load_solver(path)
+    cache.clear()
+    os.environ["AOC_DISK_CACHE"] = "0"
+    return profile(getattr(module, name), file, top=top)
+
+# Every part of a solver, each in its own fresh process
+def profile_solver(path, file, parts=None, top=5):
+    module = runner.load_solver(path)
+    reports = {}
+    for name in runner.part_names(module, parts):
+        with ProcessPoolExecutor(max_workers=1) as pool:
+            reports[name] = pool.submit(profile_part, path, file, name, top).result()
+    return reports
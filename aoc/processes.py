@@ -0,0 +1,46 @@
+"""
+Process pools that work with any start method.
+
+Solvers are loaded from their path, not imported, so a worker started with
+spawn or forkserver cannot unpickle a solver function by its module name.
+by_path() wraps such a function in a reference to its file and name, and
+the worker loads the solver from that file the first time it is called.
+
+START_METHOD picks the start method of every pool, None is the platform
+default. It can also be set with the AOC_START_METHOD environment variable.
+"""
+import multiprocessing
+import os
+import sys
+from concurrent.futures import ProcessPoolExecutor
+from functools import partial
+
+from aoc import runner
+
+START_METHOD = os.environ.get("AOC_START_METHOD") or None
+
+def executor(workers=None):
+    return ProcessPoolExecutor(max_workers=workers, mp_context=multiprocessing.get_context(START_METHOD))
+
+class SolverFunction:
+    def __init__(self, path, name):
+        self.path = path
+        self.name = name
+
+    def __call__(self, *args, **kwargs):
+        module = sys.modules.get(runner.module_name(self.path))
+        if module is None:
+            module = runner.load_solver(self.path)
+        return getattr(module, self.name)(*args, **kwargs)
+
+    def __repr__(self):
+        return f"SolverFunction({self.path!r}, {self.name!r})"
+
+# func, or a picklable reference to it when it lives in a solver (partials of one included)
+def by_path(func):
+    if isinstance(func, partial):
+        return partial(by_path(func.func), *func.args, **func.keywords)
+    module = getattr(func, "__module__", None)
+    if module == "__main__" or (module or "").startswith("aoc_"):
+        return SolverFunction(os.path.abspath(func.__code__.co_filename), func.__qualname__)
+    return func
@@ -0,0 +1,83 @@
+"""
+Performance regression check for every part, alternatives included.
+
+baselines.json, next to this file, records for each year/day/part the
+expected answer and a baseline median time. check() fails a part when its
+answer changed, or when its median time is more than `tolerance` slower
+than the baseline. Differences under MIN_SLOWDOWN_NS are ignored, as timer
+noise dominates parts that only take a few milliseconds. A part with no
+baseline fails too, so a new or renamed part can't pass unchecked.
+
+Refresh the baselines on purpose with: python -m aoc check --update
+"""
+import json
+import os
+import statistics
+
+from aoc import runner
+
+BASELINES_FILE = os.path.join(os.path.dirname(os.path.abspath(__file__)), "baselines.json")
+MIN_SLOWDOWN_NS = 10_000_000
+
+def load_baselines():
+    try:
+        with open(BASELINES_FILE) as f:
+            return json.load(f)
+    except OSError:
+        return {}
+
+def save_baselines(baselines):
+    with open(BASELINES_FILE, "w") as f:
+        json.dump(baselines, f, indent=2, sort_keys=True)
+        f.write("\n")
+
+# Median time of one part over `repeat` runs, parsing included
+def measure(module, file, name, repeat):
+    answers = set()
+    times = []
+    for _ in range(repeat):
+        answer, timings = runner.run_solver(module, file, [name[len("part"):]])
+        answers.add(answer[name])
+        times.append(sum(timings.values()))
+    if len(answers) > 1:
+        raise ValueError(f"{name} gave different answers: {answers}")
+    return answers.pop(), statistics.median(times)
+
+# Why a part fails against its baseline, or None when it passes
+def compare(base, answer, ns, tolerance=0.5):
+    if not base:
+        return "no baseline, store one with --update"
+    if answer != base["answer"]:
+        return f"answer {answer}, expected {base['answer']}"
+    if ns > base["ns"] * (1 + tolerance) and ns - base["ns"] > MIN_SLOWDOWN_NS:
+        return f"{ns / base['ns'] - 1:.0%} slower than the baseline"
+    return None
+
+# Slow alternatives only run once
+def runs_for(base, repeat):
+    return 1 if base.get("ns", 0) > 100_000_000 else repeat
+
+# Yields (key, answer, median ns, failure or None) for every part
+# The baselines file is only written with update=True
+def check(tolerance=0.5, repeat=5, update=False, only=None):
+    baselines = load_baselines()
+    for (year, day), path in runner.find_solvers().items():
+        module = runner.load_solver(path)
+        file = runner.default_input(path)
+        for name in runner.all_part_names(module):
+            key = f"{year}/{day}/{name}"
+            if only and not key.startswith(only):
+                continue
+
+            base = baselines.get(key, {})
+            answer, ns = measure(module, file, name, runs_for(base, repeat))
+
+            if update:
+                baselines[key] = {"answer": answer, "ns": ns}
+                failure = None
+            else:
+                failure = compare(base, answer, ns, tolerance)
+            yield key, answer, ns, failure
+
+    if update:
+        save_baselines(baselines)
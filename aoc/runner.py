@@ -0,0 +1,106 @@
+"""
+Finds the solvers and times them.
+
+A solver is a dayN.py file, under YEAR/ or YEAR/NN/, with part1(file) and
+part2(file) functions. If it also has a processInput(file), parsing is timed
+on its own and the parts then reuse the cached parse.
+"""
+import glob
+import importlib.util
+import os
+import re
+import statistics
+import sys
+import time
+
+from aoc import cache
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# (year, day) -> path of every solver in the repo
+def find_solvers():
+    solvers = {}
+    for path in glob.glob(os.path.join(ROOT, "[0-9]" * 4, "**", "day*.py"), recursive=True):
+        year = int(os.path.relpath(path, ROOT).split(os.sep)[0])
+        day = int(os.path.basename(path)[3:-3])
+        solvers[(year, day)] = path
+    return dict(sorted(solvers.items()))
+
+def solver_path(year, day):
+    solvers = find_solvers()
+    if (year, day) not in solvers:
+        raise SystemExit(f"No solver for {year} day {day}")
+    return solvers[(year, day)]
+
+def default_input(path):
+    return path[:-3] + "-input.txt"
+
+# 2025/01/day1.py -> aoc_2025_01_day1
+def module_name(path):
+    return "aoc_" + os.path.relpath(path, ROOT)[:-3].replace(os.sep, "_")
+
+def load_solver(path):
+    name = module_name(path)
+    spec = importlib.util.spec_from_file_location(name, path)
+    module = importlib.util.module_from_spec(spec)
+    # Registered, so forked workers can unpickle the solver's functions
+    sys.modules[name] = module
+    spec.loader.exec_module(module)
+    return module
+
+# Part names "1", "2", "2_og" ... -> part1, part2, part2_og
+def part_names(module, parts=None):
+    if parts:
+        return [f"part{part}" for part in parts]
+    return [name for name in ("part1", "part2") if hasattr(module, name)]
+
+# Parse and each part, timed separately with perf_counter_ns
+# The disk cache is off, so the parse timing is a real parse
+# Returns the answers and the timings in nanoseconds
+def run_solver(module, file, parts=None):
+    cache.clear()
+    answers = {}
+    timings = {}
+
+    disk_setting = os.environ.get("AOC_DISK_CACHE")
+    os.environ["AOC_DISK_CACHE"] = "0"
+    try:
+        if hasattr(module, "processInput"):
+            start = time.perf_counter_ns()
+            module.processInput(file)
+            timings["parse"] = time.perf_counter_ns() - start
+
+        for name in part_names(module, parts):
+            part = getattr(module, name)
+            start = time.perf_counter_ns()
+            answers[name] = part(file)
+            timings[name] = time.perf_counter_ns() - start
+    finally:
+        if disk_setting is None:
+            del os.environ["AOC_DISK_CACHE"]
+        else:
+            os.environ["AOC_DISK_CACHE"] = disk_setting
+
+    return answers, timings
+
+# Every part of a solver, alternatives such as part2_og included
+def all_part_names(module):
+    return sorted(name for name in vars(module)
+                  if re.fullmatch(r"part\d(_\w+)?", name) and callable(getattr(module, name)))
+
+def percentile(values, q):
+    values = sorted(values)
+    return values[min(len(values) - 1, int(q * len(values)))]
+
+def bench_solver(module, file, parts=None, repeat=10):
+    runs = [run_solver(module, file, parts)[1] for _ in range(repeat)]
+
+    report = {}
+    for step in runs[0]:
+        values = [run[step] for run in runs]
+        report[step] = {
+            "min": min(values),
+            "median": statistics.median(values),
+            "p95": percentile(values, 0.95),
+        }
+    return report
@@ -0,0 +1,59 @@
+"""
+Runs every (year, day, part) job on a process pool.
+
+Jobs are submitted longest first, using the timings recorded by the last
+run, so the slow ones don't end up alone at the tail of the schedule.
+Jobs with no recorded timing go first, as they might be slow.
+"""
+import json
+import os
+from concurrent.futures import ProcessPoolExecutor
+
+from aoc import runner
+
+TIMINGS_FILE = os.path.join(runner.ROOT, ".aoc-timings.json")
+
+def job_key(job):
+    year, day, name, _ = job
+    return f"{year}/{day}/{name}"
+
+def find_jobs():
+    jobs = []
+    for (year, day), path in runner.find_solvers().items():
+        module = runner.load_solver(path)
+        for name in runner.part_names(module):
+            jobs.append((year, day, name, path))
+    return jobs
+
+def load_timings():
+    try:
+        with open(TIMINGS_FILE) as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return {}
+
+def save_timings(timings):
+    with open(TIMINGS_FILE, "w") as f:
+        json.dump(timings, f, indent=2, sort_keys=True)
+
+# One job in a worker process, pinned to the solver's own input file
+# Returns the answer and the parse + part time in nanoseconds
+def run_job(job):
+    _, _, name, path = job
+    module = runner.load_solver(path)
+    answers, timings = runner.run_solver(module, runner.default_input(path), [name[len("part"):]])
+    return answers[name], sum(timings.values())
+
+# Results come back in (year, day, part) order, whatever order the jobs ran in
+def run_all(jobs=None, max_workers=None):
+    jobs = jobs if jobs is not None else find_jobs()
+    last = load_timings()
+    longest_first = sorted(jobs, key=lambda job: -last.get(job_key(job), float("inf")))
+
+    with ProcessPoolExecutor(max_workers=max_workers) as pool:
+        futures = {job_key(job): pool.submit(run_job, job) for job in longest_first}
+        results = [(job, *futures[job_key(job)].result()) for job in jobs]
+
+    last.update({job_key(job): ns for job, _, ns in results})
+    save_timings(last)
+    return results
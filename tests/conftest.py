@@ -0,0 +1,18 @@
+import os
+import sys
+
+import pytest
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# The shared aoc package lives at the repo root
+sys.path.insert(0, ROOT)
+
+from aoc import runner
+
+@pytest.fixture
+def load_solver():
+    """Imports a solver script by its path from the repo root, e.g. "2025/06/day6.py"."""
+    def load(path):
+        return runner.load_solver(os.path.join(ROOT, path))
+    return load
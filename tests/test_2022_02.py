@@ -0,0 +1,31 @@
+import random
+
+import pytest
+
+@pytest.fixture
+def day2(load_solver):
+    return load_solver("2022/day2.py")
+
+LINES = ["A X", "A Y", "A Z", "B X", "B Y", "B Z", "C X", "C Y", "C Z"]
+
+def expected_counts(lines):
+    return {line: sum(l.strip() == line for l in lines) for line in LINES}
+
+@pytest.mark.parametrize("block_size", [1, 5, 64, 1 << 18])
+def test_counts_fixed_width(day2, tmp_path, block_size):
+    rng = random.Random(block_size)
+    lines = [rng.choice(LINES) for _ in range(2000)]
+    path = tmp_path / "guide.txt"
+    path.write_text("".join(line + "\n" for line in lines))
+    assert day2.processInput(str(path), block_size) == expected_counts(lines)
+
+@pytest.mark.parametrize("text", [
+    "A X\r\nB Z\r\nC Y\r\n",     # CRLF
+    "A X\nB Z\nC Y",             # no newline at the end
+    "A X\nB  Z\nC Y\nC Y\n",     # uneven spacing, that line is skipped
+    "A X\nD X\nA W\nC Z\n",      # unknown letters are skipped
+])
+def test_counts_irregular_lines(day2, tmp_path, text):
+    path = tmp_path / "guide.txt"
+    path.write_bytes(text.encode())
+    assert day2.processInput(str(path), 8) == expected_counts(text.splitlines())
@@ -0,0 +1,39 @@
+import random
+
+import pytest
+
+from aoc import runner
+
+@pytest.fixture
+def day4(load_solver):
+    return load_solver("2022/day4.py")
+
+def random_assignments(rng):
+    return [(start, start + rng.randint(0, 6)) for start in (rng.randint(1, 15) for _ in range(rng.randint(1, 25)))]
+
+def test_overlapping_pairs_brute_force(day4):
+    rng = random.Random(14)
+    for _ in range(300):
+        ranges = random_assignments(rng)
+        expected = sum(day4.overlaps(*ranges[i], *ranges[j])
+                       for i in range(len(ranges)) for j in range(i + 1, len(ranges)))
+        assert day4.overlapping_pairs(ranges) == expected
+
+def test_most_covered_brute_force(day4):
+    rng = random.Random(41)
+    for _ in range(300):
+        ranges = random_assignments(rng)
+        # contains() is symmetric, so check the direction: j contains i
+        covered = [sum(1 for j, (start, end) in enumerate(ranges)
+                       if j != i and start <= ranges[i][0] and end >= ranges[i][1])
+                   for i in range(len(ranges))]
+        best, count = day4.most_covered(ranges)
+        assert count == max(covered)
+        assert covered[best] == count
+
+@pytest.mark.parametrize("chunk_size", [1, 7, 100, 1 << 20])
+def test_chunked_pairs_match_whole_file(day4, chunk_size):
+    file = runner.default_input(day4.__file__)
+    chunked = list(day4.iterPairs(file, chunk_size))
+    whole = day4.processInput(file)
+    assert chunked == whole
@@ -0,0 +1,34 @@
+import random
+
+import pytest
+
+@pytest.fixture
+def day1(load_solver):
+    return load_solver("2025/01/day1.py")
+
+def both_part2(day1, monkeypatch, rotations):
+    monkeypatch.setattr(day1, "processInput", lambda file: rotations)
+    return day1.part2(), day1.part2_og()
+
+@pytest.mark.parametrize("rotations", [
+    [50],               # lands on 0 going right
+    [-50],              # lands on 0 going left
+    [-50, -1],          # turns left from 0
+    [-50, 1],           # turns right from 0
+    [-50, -100],        # a full turn left from 0
+    [-50, 100, 200],    # full turns right from 0
+    [100, -300],        # multiples of 100 from 50
+    [49, 1, -1, -99],   # onto 0 and back off
+    [0, 0, -50, 0],     # no-op rotations
+])
+def test_part2_edge_cases(day1, monkeypatch, rotations):
+    fast, slow = both_part2(day1, monkeypatch, rotations)
+    assert fast == slow
+
+def test_part2_brute_force(day1, monkeypatch):
+    rng = random.Random(1)
+    for _ in range(200):
+        rotations = [rng.choice((-1, 1)) * rng.choice((rng.randint(0, 150), 100 * rng.randint(0, 3), 50))
+                     for _ in range(rng.randint(1, 30))]
+        fast, slow = both_part2(day1, monkeypatch, rotations)
+        assert fast == slow
@@ -0,0 +1,32 @@
+import random
+
+import pytest
+
+@pytest.fixture
+def day2(load_solver):
+    return load_solver("2025/02/day2.py")
+
+def brute_force(day2, start, end):
+    part1 = sum(i for i in range(start, end + 1) if day2.invalidID_part1(i))
+    part2 = sum(i for i in range(start, end + 1) if day2.invalidID_part2(i))
+    return part1, part2
+
+@pytest.mark.parametrize("start, end", [
+    (1, 9),             # single digits are never invalid
+    (9, 12),            # 9 -> 10 digit boundary, 11 is invalid
+    (95, 1015),         # two digit boundaries
+    (998, 1012),        # 999 and 1010
+    (1, 100000),        # every length up to 6, 1111 and 111111 counted once
+    (111110, 111112),   # 1 x 6, 11 x 3 and 111 x 2 at once
+])
+def test_sum_invalid_ids_boundaries(day2, start, end):
+    expected = brute_force(day2, start, end)
+    assert (day2.sumInvalidIDs(start, end, False), day2.sumInvalidIDs(start, end, True)) == expected
+
+def test_sum_invalid_ids_brute_force(day2):
+    rng = random.Random(2)
+    for _ in range(200):
+        start = rng.randint(1, 10 ** rng.randint(1, 6))
+        end = start + rng.randint(0, 5000)
+        expected = brute_force(day2, start, end)
+        assert (day2.sumInvalidIDs(start, end, False), day2.sumInvalidIDs(start, end, True)) == expected
@@ -0,0 +1,28 @@
+import itertools
+import random
+import sys
+
+import pytest
+
+@pytest.fixture
+def day3(load_solver):
+    return load_solver("2025/03/day3.py")
+
+def test_max_joltage_brute_force(day3):
+    rng = random.Random(3)
+    for _ in range(500):
+        bank = "".join(rng.choice("123456789") for _ in range(rng.randint(1, 9)))
+        k = rng.randint(1, len(bank))
+        best = max(int("".join(digits)) for digits in itertools.combinations(bank, k))
+        assert day3.max_joltage(bank, k) == best
+
+@pytest.mark.parametrize("k", [0, -1, 4, 5])
+def test_max_joltage_rejects_bad_k(day3, k):
+    with pytest.raises(ValueError):
+        day3.max_joltage("123", k)
+
+def test_max_joltage_large_k_keeps_process_limit(day3):
+    limit = sys.get_int_max_str_digits()
+    bank = "9" * 5000
+    assert day3.max_joltage(bank, 5000) == 10 ** 5000 - 1
+    assert sys.get_int_max_str_digits() == limit
@@ -0,0 +1,100 @@
+import random
+from array import array
+from multiprocessing import shared_memory
+
+import pytest
+
+from aoc import processes
+
+@pytest.fixture
+def day5(load_solver):
+    return load_solver("2025/05/day5.py")
+
+def random_ranges(rng, count, top=200, width=20):
+    return [(start, start + rng.randint(0, width)) for start in (rng.randint(0, top) for _ in range(count))]
+
+def test_count_fresh_parallel(day5):
+    rng = random.Random(23)
+    for _ in range(20):
+        ranges = random_ranges(rng, rng.randint(0, 20))
+        ingredients = [rng.randint(0, 250) for _ in range(rng.randint(0, 300))]
+        expected = sum(any(start <= x <= end for start, end in ranges) for x in ingredients)
+        assert day5.count_fresh_parallel(ranges, ingredients, rng.randint(1, 4)) == expected
+
+def test_count_fresh_parallel_with_spawn(day5, monkeypatch):
+    # Spawned workers load day5 from its path and attach to the same blocks
+    monkeypatch.setattr(processes, "START_METHOD", "spawn")
+    assert day5.count_fresh_parallel([(3, 5), (10, 14), (16, 20), (12, 18)], [1, 5, 8, 11, 17, 32], 2) == 3
+
+def test_shared_slice_error_is_not_hidden(day5, monkeypatch):
+    columns = [array("q", [1]), array("q", [5]), array("q", [3])]
+    blocks = [shared_memory.SharedMemory(create=True, size=8) for _ in columns]
+    try:
+        for block, column in zip(blocks, columns):
+            with block.buf.cast("q") as view:
+                view[:1] = column
+
+        def broken(*args):
+            raise RuntimeError("boom")
+        monkeypatch.setattr(day5, "bisect_right", broken)
+
+        # The original error, not BufferError from closing a block with live views
+        with pytest.raises(RuntimeError, match="boom"):
+            day5.count_shared_slice([block.name for block in blocks], 1, 0, 1)
+    finally:
+        for block in blocks:
+            block.close()
+            block.unlink()
+
+def test_interval_index_brute_force(day5):
+    rng = random.Random(4)
+    for _ in range(200):
+        ranges = random_ranges(rng, rng.randint(0, 10))
+        queries = [rng.randint(-5, 250) for _ in range(50)]
+        index = day5.IntervalIndex(ranges)
+        expected = [any(start <= x <= end for start, end in ranges) for x in queries]
+        assert [x in index for x in queries] == expected
+        assert index.count(queries) == sum(expected)
+
+@pytest.mark.parametrize("chunk_size", [1, 3, 8, 1000])
+def test_union_length_with_spilled_chunks(day5, chunk_size):
+    rng = random.Random(chunk_size)
+    for _ in range(50):
+        ranges = random_ranges(rng, rng.randint(0, 30))
+        covered = set()
+        for start, end in ranges:
+            covered.update(range(start, end + 1))
+        assert list(day5.external_sort(iter(ranges), chunk_size)) == sorted(ranges)
+        assert day5.union_length(iter(ranges), chunk_size) == len(covered)
+
+def test_fresh_ranges_against_a_set(day5):
+    rng = random.Random(22)
+    for _ in range(500):
+        fresh = day5.FreshRanges(random_ranges(rng, rng.randint(0, 5), top=60, width=5))
+        expected = set()
+        for start, end in zip(fresh.starts, fresh.ends):
+            expected.update(range(start, end + 1))
+
+        for _ in range(10):
+            start = rng.randint(0, 60)
+            end = start + rng.randint(0, 10)
+            if rng.random() < 0.5:
+                fresh.add_range(start, end)
+                expected.update(range(start, end + 1))
+            else:
+                fresh.remove_range(start, end)
+                expected.difference_update(range(start, end + 1))
+
+            assert fresh.total_fresh() == len(expected)
+            assert all(fresh.is_fresh(x) == (x in expected) for x in range(-2, 75))
+            # Still merged: sorted, disjoint and not adjacent
+            merged = list(zip(fresh.starts, fresh.ends))
+            assert merged == day5.merge_ranges(merged)
+
+@pytest.mark.parametrize("update", ["add_range", "remove_range"])
+def test_fresh_ranges_reject_inverted_ranges(day5, update):
+    fresh = day5.FreshRanges([(3, 5), (10, 14)])
+    with pytest.raises(ValueError):
+        getattr(fresh, update)(8, 6)
+    # Nothing changed
+    assert (fresh.starts, fresh.ends, fresh.total_fresh()) == ([3, 10], [5, 14], 8)
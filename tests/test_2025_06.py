@@ -0,0 +1,55 @@
+import random
+
+import pytest
+
+from aoc import generate
+
+EXAMPLE = (
+    "123 328  51 64 \n"
+    " 45 64  387 23 \n"
+    "  6 98  215 314\n"
+    "*   +   *   +  \n"
+)
+
+# Left-aligned numbers of different lengths: the middle column reads "2 5"
+UNEVEN = (
+    "12\n"
+    "3 \n"
+    "45\n"
+    "+ \n"
+)
+
+@pytest.fixture
+def day6(load_solver):
+    return load_solver("2025/06/day6.py")
+
+def write_input(tmp_path, monkeypatch, text):
+    (tmp_path / "day6-input.txt").write_text(text)
+    monkeypatch.chdir(tmp_path)
+
+def test_part2_example(day6, tmp_path, monkeypatch):
+    write_input(tmp_path, monkeypatch, EXAMPLE)
+    assert day6.part2() == 3263827
+
+def test_part2_uneven_left_aligned(day6, tmp_path, monkeypatch):
+    write_input(tmp_path, monkeypatch, UNEVEN)
+    # 134 + 25
+    assert day6.part2() == 159
+
+@pytest.mark.parametrize("block_width", [1, 2, 3, 5, 100])
+def test_problems_across_blocks(day6, tmp_path, monkeypatch, block_width):
+    write_input(tmp_path, monkeypatch, EXAMPLE)
+    problems = list(day6.iterProblems("day6-input.txt", block_width))
+    assert [problem[-1].strip() for problem in problems] == [b"*", b"+", b"*", b"+"]
+    assert problems[0] == [b"123", b" 45", b"  6", b"*  "]
+
+def test_generated_worksheet_streams_cells(day6, tmp_path):
+    # At most one cell of up to 4 digits and its separator per piece
+    pieces = list(generate.worksheet(random.Random(0), 2))
+    assert max(map(len, pieces)) <= 5
+    lines = "".join(pieces).splitlines()
+    assert len(lines) == 5 and len(set(map(len, lines))) == 1
+
+    path = str(tmp_path / "worksheet.txt")
+    generate.write_input(2025, 6, path, 2)
+    assert len(list(day6.iterProblems(path, 1 << 10))) == 2000
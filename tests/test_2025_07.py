@@ -0,0 +1,36 @@
+import random
+
+import pytest
+
+from aoc import generate
+
+@pytest.fixture
+def day7(load_solver):
+    return load_solver("2025/07/day7.py")
+
+@pytest.mark.parametrize("seed", range(5))
+def test_sweep_matches_parts(day7, tmp_path, seed):
+    path = str(tmp_path / "manifold.txt")
+    generate.write_input(2025, 7, path, random.Random(seed).randint(1, 3), seed)
+    assert day7.sweep(path) == (day7.part1(path), day7.part2(path))
+
+def random_grid(rng):
+    width = rng.randint(1, 20)
+    grid = [["."] * width for _ in range(rng.randint(2, 15))]
+    for row in grid[1:]:
+        for col in range(width):
+            if rng.random() < 0.4:
+                row[col] = "^"
+    return grid
+
+def test_timeline_matrix_every_start_column(day7, monkeypatch):
+    rng = random.Random(24)
+    for _ in range(100):
+        grid = random_grid(rng)
+        matrix = day7.TimelineMatrix(grid)
+        for start in range(len(grid[0])):
+            # Forward part2 from this start column
+            data = [row[:] for row in grid]
+            data[0][start] = "S"
+            monkeypatch.setattr(day7, "processInput", lambda file, data=data: data)
+            assert matrix.timelines_from(start) == day7.part2()
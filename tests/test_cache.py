@@ -0,0 +1,83 @@
+import importlib.util
+import os
+
+import pytest
+
+from aoc import cache
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+SOLVER = """
+import sys
+sys.path.insert(0, {root!r})
+from aoc.cache import cached_input
+
+FACTOR = {factor}
+
+def parseNumbers(text):
+    return [int(n) * FACTOR for n in text.split()]
+
+@cached_input
+def processInput(file):
+    with open(file) as f:
+        return parseNumbers(f.read())
+"""
+
+@pytest.fixture
+def disk_cache(tmp_path, monkeypatch):
+    monkeypatch.setattr(cache, "CACHE_DIR", str(tmp_path / "cache"))
+    monkeypatch.setenv("AOC_DISK_CACHE", "1")
+    cache.clear()
+    yield
+    cache.clear()
+
+def load(path, name):
+    spec = importlib.util.spec_from_file_location(name, path)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+def write_solver(path, factor):
+    path.write_text(SOLVER.format(root=ROOT, factor=factor))
+
+def test_disk_hit_on_second_run(tmp_path, disk_cache):
+    (tmp_path / "input.txt").write_text("1 2 3")
+    write_solver(tmp_path / "solver.py", 1)
+
+    assert load(tmp_path / "solver.py", "cache_solver_a").processInput(str(tmp_path / "input.txt")) == [1, 2, 3]
+    cache.clear()
+    assert load(tmp_path / "solver.py", "cache_solver_b").processInput(str(tmp_path / "input.txt")) == [1, 2, 3]
+    assert cache.stats == {"hits": 0, "disk_hits": 1, "misses": 0}
+
+def test_changed_helper_misses_the_disk_cache(tmp_path, disk_cache):
+    (tmp_path / "input.txt").write_text("1 2 3")
+    write_solver(tmp_path / "solver.py", 1)
+    load(tmp_path / "solver.py", "cache_solver_c").processInput(str(tmp_path / "input.txt"))
+
+    # Only a helper constant changes, processInput itself is untouched
+    cache.clear()
+    write_solver(tmp_path / "solver.py", 2)
+    assert load(tmp_path / "solver.py", "cache_solver_d").processInput(str(tmp_path / "input.txt")) == [2, 4, 6]
+    assert cache.stats["misses"] == 1
+
+def test_new_input_replaces_its_old_pickle(tmp_path, disk_cache):
+    write_solver(tmp_path / "solver.py", 1)
+    solver = load(tmp_path / "solver.py", "cache_solver_e")
+    for text in ("1", "1 2", "1 2 3"):
+        (tmp_path / "input.txt").write_text(text)
+        solver.processInput(str(tmp_path / "input.txt"))
+    assert len(os.listdir(cache.CACHE_DIR)) == 1
+
+def test_disk_cache_keeps_the_most_recent_entries(tmp_path, disk_cache, monkeypatch):
+    monkeypatch.setattr(cache, "MAX_DISK_ENTRIES", 3)
+    write_solver(tmp_path / "solver.py", 1)
+    solver = load(tmp_path / "solver.py", "cache_solver_f")
+    for i in range(5):
+        (tmp_path / f"input{i}.txt").write_text(str(i))
+        solver.processInput(str(tmp_path / f"input{i}.txt"))
+    assert len(os.listdir(cache.CACHE_DIR)) == 3
+
+    # The newest inputs are still on disk
+    cache.clear()
+    assert solver.processInput(str(tmp_path / "input4.txt")) == [4]
+    assert cache.stats["disk_hits"] == 1
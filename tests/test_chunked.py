@@ -0,0 +1,85 @@
+import random
+
+import pytest
+
+from aoc import cache, chunked, processes
+
+@pytest.fixture(autouse=True)
+def no_disk_cache(monkeypatch):
+    monkeypatch.setenv("AOC_DISK_CACHE", "0")
+    cache.clear()
+    yield
+    cache.clear()
+
+@pytest.fixture
+def parallel(monkeypatch):
+    # Real inputs are all under PARALLEL_MIN, force the chunked path
+    monkeypatch.setattr(chunked, "PARALLEL_MIN", 0)
+
+@pytest.mark.parametrize("separator, chunks", [(b"\n", 1), (b"\n", 3), (b"\n", 50), (b"\n\n", 7)])
+def test_boundaries_cut_after_separators(separator, chunks):
+    data = b"1\n22\n\n333\n4\n\n55\n"
+    bounds = chunked.boundaries(data, separator, chunks)
+    assert bounds[0][0] == 0 and bounds[-1][1] == len(data)
+    assert all(end == start for (_, end), (start, _) in zip(bounds, bounds[1:]))
+    assert all(data[:end].endswith(separator) for _, end in bounds[:-1])
+
+def test_rotations_in_parallel_chunks(load_solver, tmp_path, parallel):
+    day1 = load_solver("2025/01/day1.py")
+    rng = random.Random(1)
+    rotations = [rng.choice((-1, 1)) * rng.randint(1, 999) for _ in range(5000)]
+    path = tmp_path / "rotations.txt"
+    path.write_text("".join(f"{'L' if r < 0 else 'R'}{abs(r)}\n" for r in rotations))
+
+    assert day1.processInput(str(path), workers=3).tolist() == rotations
+    assert day1.processInput(str(path), workers=1).tolist() == rotations
+    # workers is not part of the key
+    assert cache.stats["hits"] == 1
+
+@pytest.mark.parametrize("workers", [1, 2, 7, 40])
+def test_dial_joined_across_chunks(load_solver, tmp_path, parallel, workers):
+    day1 = load_solver("2025/01/day1.py")
+    rng = random.Random(workers)
+    # Zero and full-turn rotations too, so chunks start on 0 and on every other position
+    rotations = [rng.choice((-1, 1)) * rng.choice((rng.randint(0, 250), 100, 50)) for _ in range(3000)]
+    path = tmp_path / "rotations.txt"
+    path.write_text("".join(f"{'L' if r < 0 else 'R'}{abs(r)}\n" for r in rotations))
+
+    assert len(day1.processSummaries(str(path), workers)) == min(workers, len(rotations))
+    assert day1.countZeros(str(path), workers) == (day1.part1(str(path)), day1.part2_og(str(path)))
+
+def test_elf_groups_in_parallel_chunks(load_solver, tmp_path, parallel):
+    day1 = load_solver("2022/day1.py")
+    rng = random.Random(2)
+    elves = [[rng.randint(1000, 60000) for _ in range(rng.randint(1, 8))] for _ in range(2000)]
+    path = tmp_path / "calories.txt"
+    path.write_text("\n\n".join("\n".join(map(str, elf)) for elf in elves) + "\n")
+
+    expected = sorted(map(sum, elves), reverse=True)[:3]
+    for workers in (1, 2, 5):
+        assert day1.top_k_parallel(3, str(path), workers) == expected
+    assert day1.top_k(3, str(path)) == expected
+
+@pytest.mark.parametrize("text", [
+    "1000\r\n2000\r\n\r\n3000\r\n",
+    "1000\n2000\n \n3000\n\t\n\n4000",
+    "\n\n5\n\n\n6\n7\n\n",
+    "8\n9\n",
+])
+@pytest.mark.parametrize("workers", [1, 2, 3, 8])
+def test_elf_groups_match_top_k(load_solver, tmp_path, parallel, text, workers):
+    # Blank lines that are CRLF or only whitespace end an elf in both versions
+    day1 = load_solver("2022/day1.py")
+    path = tmp_path / "calories.txt"
+    path.write_bytes(text.encode())
+    for k in (1, 3):
+        assert day1.top_k_parallel(k, str(path), workers) == day1.top_k(k, str(path))
+
+@pytest.mark.parametrize("start_method", ["spawn", "forkserver"])
+def test_solver_chunks_without_fork(load_solver, tmp_path, parallel, monkeypatch, start_method):
+    # Workers that do not inherit the parent's memory load the solver from its path
+    monkeypatch.setattr(processes, "START_METHOD", start_method)
+    day1 = load_solver("2022/day1.py")
+    path = tmp_path / "calories.txt"
+    path.write_text("1000\n2000\n\n4000\n\n5000\n6000\n\n7000\n8000\n9000\n\n10000\n")
+    assert day1.top_k_parallel(3, str(path), 2) == [24000, 11000, 10000]
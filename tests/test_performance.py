@@ -0,0 +1,51 @@
+"""
+Every part against aoc/baselines.json: the answer must match and the time
+must stay within the tolerance of the stored baseline.
+
+The answers are always checked. Timings depend on the machine and its load,
+so they are only checked with AOC_CHECK_TIMINGS=1.
+"""
+import os
+
+import pytest
+
+from aoc import regression, runner
+
+BASELINES = regression.load_baselines()
+SOLVERS = runner.find_solvers()
+CHECK_TIMINGS = os.environ.get("AOC_CHECK_TIMINGS") == "1"
+
+def all_keys():
+    keys = []
+    for (year, day), path in SOLVERS.items():
+        module = runner.load_solver(path)
+        keys += [f"{year}/{day}/{name}" for name in runner.all_part_names(module)]
+    return keys
+
+@pytest.fixture(autouse=True)
+def no_disk_cache(monkeypatch):
+    monkeypatch.setenv("AOC_DISK_CACHE", "0")
+
+def test_every_part_has_a_baseline():
+    assert sorted(all_keys()) == sorted(BASELINES)
+
+@pytest.mark.parametrize("key", sorted(BASELINES))
+def test_part_against_baseline(key):
+    year, day, name = key.split("/")
+    path = SOLVERS[(int(year), int(day))]
+    module = runner.load_solver(path)
+    base = BASELINES[key]
+
+    repeat = regression.runs_for(base, 3) if CHECK_TIMINGS else 1
+    answer, ns = regression.measure(module, runner.default_input(path), name, repeat)
+    assert answer == base["answer"]
+    if CHECK_TIMINGS:
+        assert regression.compare(base, answer, ns) is None
+
+def test_missing_baseline_fails():
+    assert regression.compare({}, 1, 1) is not None
+
+def test_short_parts_ignore_timer_noise():
+    # 1.5 ms baseline, 5.4 ms run: 260% slower but within the noise floor
+    assert regression.compare({"answer": 1, "ns": 1_500_000}, 1, 5_400_000) is None
+    assert regression.compare({"answer": 1, "ns": 1_500_000}, 1, 50_000_000) is not None